@@ -0,0 +1,4 @@
+"""Benchmarks of the check engine on generated projects.
+
+Run with `python -m benchmarks --help`.
+"""
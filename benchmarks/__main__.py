@@ -0,0 +1,76 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from importlib.util import find_spec
+
+import django
+from django.conf import settings
+
+from . import project, suite
+
+
+def main(argv: "list[str] | None" = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Time extra checks on a generated django project.",
+    )
+    parser.add_argument("--apps", type=int, default=5, help="number of apps")
+    parser.add_argument("--models", type=int, default=20, help="models per app")
+    parser.add_argument("--fields", type=int, default=14, help="fields per model")
+    parser.add_argument("--repeat", type=int, default=5, help="runs of each timing")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--no-drf", action="store_true", help="don't generate serializers"
+    )
+    parser.add_argument("-o", "--output", help="write json to file instead of stdout")
+    args = parser.parse_args(argv)
+    drf = not args.no_drf and find_spec("rest_framework") is not None
+
+    with tempfile.TemporaryDirectory(prefix="extra_checks_bench") as path:
+        app_names = project.generate(
+            path,
+            apps=args.apps,
+            models=args.models,
+            fields=args.fields,
+            serializers=drf,
+            seed=args.seed,
+        )
+        sys.path.insert(0, path)
+        settings.configure(**suite.settings_for(app_names, drf=drf))
+        start = time.perf_counter()
+        django.setup()
+        setup_time = time.perf_counter() - start
+        results = suite.run(app_names, repeat=args.repeat, drf=drf)
+
+    report = {
+        "params": {
+            "apps": args.apps,
+            "models": args.models,
+            "fields": args.fields,
+            "repeat": args.repeat,
+            "seed": args.seed,
+            "drf": drf,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "django_setup": setup_time,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
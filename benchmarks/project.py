@@ -0,0 +1,121 @@
+"""Generator of synthetic django projects."""
+
+import os
+import random
+import textwrap
+
+import django
+
+MODULE_HEADER = """\
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+"""
+
+SERIALIZERS_HEADER = """\
+from rest_framework import serializers
+
+from . import models
+"""
+
+
+def _field(app: str, model: int, field: int, rnd: random.Random) -> list[str]:
+    name = f"field_{field}"
+    kind = field % 7
+    if kind == 0:
+        line = f'{name} = models.CharField(_("field {field}"), max_length=100)'
+    elif kind == 1:
+        line = (
+            f'{name} = models.IntegerField(verbose_name="Field {field}", '
+            f'choices=[(1, "one"), (2, "two"), (3, "three")])'
+        )
+    elif kind == 2:
+        line = f'{name} = models.TextField(_("field {field}"), null=True, help_text="help")'
+    elif kind == 3:
+        target = f'"{app}.Model{model - 1}"' if model else '"self"'
+        line = (
+            f"{name} = models.ForeignKey({target}, on_delete=models.CASCADE, "
+            f'related_name="+", verbose_name=_("field {field}"))'
+        )
+    elif kind == 4:
+        line = f"{name} = models.BooleanField(default=False, null=False)"
+    elif kind == 5:
+        line = f'{name} = models.FileField(_("field {field}"), upload_to="")'
+    else:
+        line = f"{name} = models.DateTimeField(null=True, default=None)"
+    if rnd.random() < 0.1:
+        return ["# extra-checks-disable-next-line", line]
+    return [line]
+
+
+def _model(app: str, model: int, fields: int, rnd: random.Random) -> str:
+    body = []
+    for field in range(fields):
+        body.extend(_field(app, model, field, rnd))
+    choices = [f"field_{f}" for f in range(fields) if f % 7 == 1]
+    fks = [f"field_{f}" for f in range(fields) if f % 7 == 3]
+    arg = "condition" if django.VERSION >= (5, 1) else "check"
+    meta = [f'db_table = "{app}_model{model}"', "constraints = ["]
+    for name in choices[::2]:
+        meta.append(
+            f'    models.CheckConstraint(name="{app}_{model}_{name}", '
+            f"{arg}=models.Q({name}__in=[1, 2, 3])),"
+        )
+    meta.append("]")
+    meta.append(f"indexes = [models.Index(fields={fks[:2]!r})]" if fks else "")
+    if model % 5 == 0:
+        meta.insert(0, "# extra-checks-disable-next-line no-unique-together")
+    lines = [
+        f"class Model{model}(models.Model):",
+        *(f"    {line}" for line in body),
+        "",
+        "    class Meta:",
+        *(f"        {line}" for line in meta if line),
+    ]
+    return "\n".join(lines)
+
+
+def _serializer(model: int) -> str:
+    extra = ""
+    if model % 3 == 0:
+        extra = """
+            field_0 = serializers.CharField()
+        """
+    return textwrap.dedent(
+        f"""
+        class Model{model}Serializer(serializers.ModelSerializer):{extra}
+            class Meta:
+                model = models.Model{model}
+                fields = "__all__"
+                extra_kwargs = {{"field_0": {{"required": False}}}}
+        """
+    )
+
+
+def generate(
+    path: str,
+    *,
+    apps: int,
+    models: int,
+    fields: int,
+    serializers: bool = True,
+    seed: int = 0,
+) -> list[str]:
+    """Write apps into `path` and return their names."""
+    rnd = random.Random(seed)
+    names = []
+    for i in range(apps):
+        app = f"bench_app_{i}"
+        os.makedirs(os.path.join(path, app))
+        with open(os.path.join(path, app, "__init__.py"), "w"):
+            pass
+        with open(os.path.join(path, app, "models.py"), "w") as f:
+            f.write(MODULE_HEADER)
+            for model in range(models):
+                f.write("\n\n" + _model(app, model, fields, rnd) + "\n")
+        if serializers:
+            with open(os.path.join(path, app, "serializers.py"), "w") as f:
+                f.write(SERIALIZERS_HEADER)
+                for model in range(models):
+                    f.write("\n" + _serializer(model))
+        names.append(app)
+    return names
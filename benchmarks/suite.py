@@ -0,0 +1,229 @@
+"""Timings of the check engine on a generated project."""
+
+import gc
+import importlib
+import linecache
+import statistics
+import time
+from collections.abc import Iterable
+from functools import partial
+from typing import Any, Callable, Optional
+
+from django.apps import apps
+
+from extra_checks import CheckId
+from extra_checks.ast import get_model_ast
+from extra_checks.ast.source_provider import ModuleSource, source_store
+from extra_checks.registry import registry
+
+# checks that require state outside of the generated project
+EXCLUDED_CHECKS = {CheckId.X012}
+# checks that require configuration, see `settings_for`
+CONFIGURED = {CheckId.X010, CheckId.X011, CheckId.X302}
+
+
+def settings_for(app_names: Iterable[str], *, drf: bool) -> dict[str, Any]:
+    app_names = list(app_names)
+    return {
+        "SECRET_KEY": "benchmark",
+        "INSTALLED_APPS": [
+            "django.contrib.contenttypes",
+            "django.contrib.auth",
+            *app_names,
+            *(["rest_framework"] if drf else []),
+            "extra_checks",
+        ],
+        "DATABASES": {"default": {"ENGINE": "django.db.backends.sqlite3"}},
+        "EXTRA_CHECKS": {
+            "include_apps": app_names,
+            "checks": [
+                {"id": "model-attribute", "attrs": ["objects"]},
+                {"id": "model-meta-attribute", "attrs": ["db_table"]},
+                {"id": "drf-model-serializer-meta-attribute", "attrs": ["fields"]},
+                *(c.value for c in CheckId if c not in EXCLUDED_CHECKS | CONFIGURED),
+            ],
+        },
+    }
+
+
+def _clear_sources() -> None:
+    source_store.clear()
+    linecache.clearcache()
+
+
+def _reset(modules: Iterable[Optional[ModuleSource]], *names: str) -> None:
+    """Drop cached properties of modules."""
+    for module in modules:
+        for name in names:
+            if module:
+                module.__dict__.pop(name, None)
+
+
+def _timeit(
+    f: Callable[[], Any],
+    repeat: int,
+    setup: Optional[Callable[[], Any]] = None,
+) -> dict[str, Any]:
+    timings = []
+    result = None
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        gc.collect()
+        start = time.perf_counter()
+        result = f()
+        timings.append(time.perf_counter() - start)
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "max": max(timings),
+        "count": result,
+    }
+
+
+def _bind() -> int:
+    registry.enabled_checks = {}
+    registry._bound_handlers = registry._bind()
+    return len(registry._bound_handlers)
+
+
+def _statement_lines(
+    modules: dict[type, Optional[ModuleSource]],
+) -> list[tuple[ModuleSource, int]]:
+    """Return lines of classes and statements of their bodies."""
+    lines = []
+    for m, module in modules.items():
+        node = module.find_class(m) if module else None
+        if module and node:
+            lines.append((module, node.lineno))
+            lines.extend((module, child.lineno) for child in node.body)
+    return lines
+
+
+def _prepare_model(model: type, meta_ids: list[CheckId]) -> tuple[type, Any, list]:
+    model_ast = get_model_ast(model, meta_ids)
+    return model, model_ast, list(model_ast.field_nodes)
+
+
+def _apply_model_checks(
+    prepared: list[tuple[type, Any, list]], model_checks: list, field_checks: Any
+) -> int:
+    count = 0
+    for model, model_ast, fields in prepared:
+        for check in model_checks:
+            count += sum(1 for _ in check.apply(model, ast=model_ast))
+        for field, field_ast in fields:
+            for check in field_checks[type(field)]:
+                count += sum(1 for _ in check.apply(field, ast=field_ast, model=model))
+    return count
+
+
+def _models_phases(models: list[type], repeat: int) -> dict[str, Any]:
+    checks = registry.enabled_checks.get("models", [])
+    from extra_checks.checks.model_checks import CheckModelMeta, FieldChecksTable
+    from extra_checks.checks.model_field_checks import CheckModelField
+
+    meta_ids = [c.Id for c in checks if isinstance(c, CheckModelMeta)]
+    model_checks = [c for c in checks if not isinstance(c, CheckModelField)]
+    field_checks = FieldChecksTable(c for c in checks if isinstance(c, CheckModelField))
+
+    def load() -> int:
+        return len({source_store.get_module(m) for m in models})
+
+    results = {"source": _timeit(load, repeat, _clear_sources)}
+
+    _clear_sources()
+    load()
+    modules = {m: source_store.get_module(m) for m in models}
+
+    def parse() -> int:
+        return sum(
+            1 for m, module in modules.items() if module and module.find_class(m)
+        )
+
+    results["parse"] = _timeit(
+        parse, repeat, partial(_reset, modules.values(), "tree", "_classes")
+    )
+
+    parse()
+    lines = _statement_lines(modules)
+
+    def lookup() -> int:
+        return sum(
+            1 for module, line in lines if module.get_disabled_checks_for_line(line)
+        )
+
+    results["comments"] = _timeit(
+        lookup, repeat, partial(_reset, modules.values(), "_disabled_checks")
+    )
+
+    prepared = [_prepare_model(m, meta_ids) for m in models]
+
+    results["apply"] = _timeit(
+        partial(_apply_model_checks, prepared, model_checks, field_checks), repeat
+    )
+    return results
+
+
+def _serializers_phases(serializers: list[type], repeat: int) -> dict[str, Any]:
+    from extra_checks.checks.drf_serializer_checks import (
+        DisableCommentProvider,
+        DisableMetaCommentProvider,
+    )
+
+    def load() -> int:
+        return len({source_store.get_module(s) for s in serializers})
+
+    results = {"source": _timeit(load, repeat, _clear_sources)}
+
+    def lookup() -> int:
+        return sum(
+            DisableCommentProvider(s).is_disabled_by_comment("X301")
+            + DisableMetaCommentProvider(s).is_disabled_by_comment("X302")
+            for s in serializers
+        )
+
+    results["comments"] = _timeit(lookup, repeat, _clear_sources)
+
+    checks = registry.enabled_checks.get("extra_checks_drf_serializer", [])
+
+    def apply() -> int:
+        return sum(1 for s in serializers for check in checks for _ in check.apply(s))
+
+    results["apply"] = _timeit(apply, repeat)
+    return results
+
+
+def run(app_names: list[str], *, repeat: int, drf: bool) -> dict[str, Any]:
+    results: dict[str, Any] = {"bind": _timeit(_bind, repeat)}
+    handlers = registry._bound_handlers or {}
+
+    models = [
+        m
+        for config in apps.get_app_configs()
+        if config.name in app_names
+        for m in config.get_models()
+    ]
+    results["check_models"] = _timeit(
+        lambda: len(list(handlers["models"]())), repeat, _clear_sources
+    )
+    results["check_models"]["phases"] = _models_phases(models, repeat)
+
+    if drf:
+        serializers: list[type] = []
+        for name in app_names:
+            module = importlib.import_module(f"{name}.serializers")
+            serializers.extend(
+                v
+                for v in vars(module).values()
+                if isinstance(v, type) and v.__module__ == module.__name__
+            )
+        results["check_drf_serializers"] = _timeit(
+            lambda: len(list(handlers["extra_checks_drf_serializer"]())),
+            repeat,
+            _clear_sources,
+        )
+        results["check_drf_serializers"]["phases"] = _serializers_phases(
+            serializers, repeat
+        )
+    return results
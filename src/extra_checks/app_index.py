@@ -0,0 +1,66 @@
+import fnmatch
+import site
+import sys
+from collections.abc import Iterable
+from typing import Optional
+
+import django.apps
+from django.apps import AppConfig
+
+
+class AppIndex:
+    """Map modules to installed apps and tell third-party code apart.
+
+    A module belongs to the app with the longest name that is a dotted prefix
+    of the module name, so nested apps (e.g. `rest_framework.authtoken`)
+    don't fall into their parent app. Code is third-party if its file is
+    under one of `site.PREFIXES`.
+    """
+
+    def __init__(
+        self,
+        app_configs: Optional[Iterable[AppConfig]] = None,
+        exclude_apps: Optional[Iterable[str]] = None,
+    ) -> None:
+        if app_configs is None:
+            app_configs = django.apps.apps.get_app_configs()
+        self._apps = {app.name: app for app in app_configs}
+        self._site_prefixes = tuple(set(site.PREFIXES))
+        self._exclude_apps = tuple(exclude_apps or ())
+        self._modules: dict[str, Optional[AppConfig]] = {}
+        self._third_party_modules: dict[str, bool] = {}
+
+    def get_app(self, module_name: str) -> Optional[AppConfig]:
+        try:
+            return self._modules[module_name]
+        except KeyError:
+            pass
+        app = self._apps.get(module_name)
+        if app is None and "." in module_name:
+            app = self.get_app(module_name.rpartition(".")[0])
+        self._modules[module_name] = app
+        return app
+
+    def is_third_party_path(self, path: Optional[str]) -> bool:
+        return path is not None and path.startswith(self._site_prefixes)
+
+    def is_third_party_app(self, app: AppConfig) -> bool:
+        return self.is_third_party_path(app.path)
+
+    def is_third_party_module(self, module_name: str) -> bool:
+        try:
+            return self._third_party_modules[module_name]
+        except KeyError:
+            pass
+        module = sys.modules.get(module_name)
+        result = self.is_third_party_path(getattr(module, "__file__", None))
+        self._third_party_modules[module_name] = result
+        return result
+
+    def is_excluded(self, app: AppConfig) -> bool:
+        """Match app name, label or path against `exclude_apps` glob patterns."""
+        return any(
+            fnmatch.fnmatchcase(value, pattern)
+            for pattern in self._exclude_apps
+            for value in (app.name, app.label, app.path)
+        )
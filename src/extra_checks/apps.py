@@ -1,6 +1,5 @@
 from django.apps import AppConfig
 
-from . import checks  # noqa
 from .registry import registry
 
 
@@ -9,4 +8,4 @@ class ExtraChecksConfig(AppConfig):
 
     def ready(self) -> None:
         super().ready()
-        registry.bind()
+        registry.bind_lazy()
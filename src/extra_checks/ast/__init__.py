@@ -1,9 +1,7 @@
 from collections.abc import Container
-
-from django.db import models
+from typing import TYPE_CHECKING
 
 from ..check_id import CheckId
-from .ast import ModelAST
 from .exceptions import MissingASTError
 from .protocols import (
     ArgASTProtocol,
@@ -12,11 +10,18 @@ from .protocols import (
     ModelASTProtocol,
 )
 
+if TYPE_CHECKING:
+    from django.db import models
+
 
 def get_model_ast(
-    model_cls: type[models.Model],
+    model_cls: "type[models.Model]",
     meta_checks: Container[CheckId],
 ) -> ModelASTDisableCommentProtocol:
+    # django models are imported on demand, `extra_checks.static` uses
+    # source analysis of this package without django setup
+    from .ast import ModelAST
+
     return ModelAST(model_cls, meta_checks)
 
 
@@ -1,182 +1,125 @@
-import ast
-from collections.abc import Container, Iterable, Iterator
-from functools import partial
-from typing import (
-    TYPE_CHECKING,
-    Callable,
-    Optional,
-    Union,
-    cast,
-)
+from collections.abc import Container, Iterator
+from typing import Any, NamedTuple, Optional
 
 from django.db import models
-from django.utils.functional import SimpleLazyObject
 
 from extra_checks.check_id import CheckId
 
-from .exceptions import MissingASTError
 from .protocols import (
     ArgASTProtocol,
     DisableCommentProtocol,
-    FieldASTProtocol,
     ModelASTProtocol,
 )
+from .source_facts import FieldFacts
 from .source_provider import SourceProvider
 
-if TYPE_CHECKING:
-    cached_property = property
-else:
-    from django.utils.functional import cached_property
-
 
 class ModelAST(DisableCommentProtocol, ModelASTProtocol):
+    __slots__ = ("_fields", "_source_provider", "meta_checks", "model_cls")
+
     def __init__(self, model_cls: type[models.Model], meta_checks: Container[CheckId]):
         self.model_cls = model_cls
         self.meta_checks = meta_checks
-        self._assignment_nodes: list[ast.Assign] = []
-        self._meta: Optional[ast.ClassDef] = None
-
-    @cached_property
-    def _source_provider(self) -> SourceProvider:
-        return SourceProvider(self.model_cls)
-
-    @cached_property
-    def _nodes(self) -> Iterator[ast.AST]:
-        if self._source_provider.source is None:
-            return iter([])
-        return iter(ast.parse(self._source_provider.source).body[0].body)  # type: ignore
-
-    def _parse(self, predicate: Optional[Callable[[ast.AST], bool]] = None) -> None:
-        try:
-            for node in self._nodes:
-                if predicate and predicate(node):
-                    self._meta = cast(ast.ClassDef, node)
-                    break
-                if isinstance(node, ast.Assign):
-                    self._assignment_nodes.append(node)
-        except StopIteration:
-            return
-        return
-
-    @cached_property
-    def _meta_node(self) -> Optional[ast.ClassDef]:
-        if not self._meta:
-            self._parse(
-                lambda node: isinstance(node, ast.ClassDef) and node.name == "Meta"
-            )
-        return self._meta
-
-    @cached_property
-    def _meta_vars(self) -> dict[str, ast.Assign]:
-        data: dict[str, ast.Assign] = {}
-        if not self._meta_node:
-            return data
-        for node in ast.iter_child_nodes(self._meta_node):
-            if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name):
-                data[node.targets[0].id] = node
-        return data
-
-    @cached_property
-    def _assignments(self) -> dict[str, ast.Assign]:
-        self._parse()
-        result = {}
-        for node in self._assignment_nodes:
-            if isinstance(node.targets[0], ast.Name):
-                result[node.targets[0].id] = node
-        return result
-
-    @cached_property
-    def field_nodes(self) -> Iterable[tuple[models.fields.Field, "FieldAST"]]:
+        self._source_provider = SourceProvider(model_cls)
+        self._fields: Optional[list[tuple[models.Field, FieldAST]]] = None
+
+    @property
+    def field_nodes(self) -> Iterator[tuple[models.fields.Field, "FieldAST"]]:
+        """Yield fields defined in the class body with their arguments."""
+        if self._fields is None:
+            facts = self._source_provider.facts
+            fields = facts.fields if facts else {}
+            self._fields = []
+            for field in self.model_cls._meta.get_fields(include_parents=False):
+                if isinstance(field, models.Field) and field.name in fields:
+                    self._fields.append(
+                        (
+                            field,
+                            _get_field_ast(
+                                fields[field.name], field, self._source_provider
+                            ),
+                        )
+                    )
+        return iter(self._fields)
+
+    @property
+    def inherited_field_nodes(
+        self,
+    ) -> Iterator[tuple[models.fields.Field, "FieldAST"]]:
+        """Yield fields inherited from abstract models with arguments and
+        disable comments of the abstract model that defines them."""
+        facts = self._source_provider.facts
+        defined = facts.fields if facts else {}
+        bases = [
+            SourceProvider(base)
+            for base in self.model_cls.__mro__[1:]
+            if issubclass(base, models.Model)
+            and base is not models.Model
+            and base._meta.abstract
+        ]
         for field in self.model_cls._meta.get_fields(include_parents=False):
-            if isinstance(field, models.Field):
-                yield (
-                    field,
-                    cast(
-                        FieldAST, SimpleLazyObject(partial(get_field_ast, self, field))
-                    ),
-                )
+            if not isinstance(field, models.Field) or field.name in defined:
+                continue
+            for provider in bases:
+                base_facts = provider.facts
+                if base_facts and field.name in base_facts.fields:
+                    yield (
+                        field,
+                        _get_field_ast(base_facts.fields[field.name], field, provider),
+                    )
+                    break
 
     def has_meta_var(self, name: str) -> bool:
-        return name in self._meta_vars
+        facts = self._source_provider.facts
+        return facts is not None and name in facts.meta_vars
 
     def is_disabled_by_comment(self, check_id: str) -> bool:
+        facts = self._source_provider.facts
+        if facts is None:
+            return False
         check = CheckId.find_check(check_id)
-        if check in self.meta_checks:
-            if not self._meta_node:
-                # class Meta is not defined on model
-                return False
-            return check in self._source_provider.get_disabled_checks_for_line(
-                self._meta_node.lineno
-            )
-        return check in self._source_provider.get_disabled_checks_for_line(1)
-
-
-def get_field_ast(model_ast: ModelAST, field: models.Field) -> "FieldAST":
-    try:
-        return FieldAST(
-            model_ast._assignments[field.name], field, model_ast._source_provider
-        )
-    except KeyError:
-        raise MissingASTError()
+        lineno = facts.meta_lineno if check in self.meta_checks else facts.lineno
+        if lineno is None:
+            # class Meta is not defined on model
+            return False
+        return self._source_provider.is_disabled_for_line(lineno, check)
 
 
-class ArgAST(ArgASTProtocol):
-    def __init__(self, node: ast.AST):
-        self._node = node
+class ArgAST(NamedTuple):
+    is_callable: bool
+    callable_func_name: Optional[str]
+    # constant value of the argument or of the first argument of the call
+    value: Any
 
-    @cached_property
-    def is_callable(self) -> bool:
-        return isinstance(self._node, ast.Call)
+    def get_call_first_args(self) -> Any:
+        return self.value
 
-    @cached_property
-    def callable_func_name(self) -> Optional[str]:
-        return (
-            getattr(self._node.func, "id", None)
-            if isinstance(self._node, ast.Call)
-            else None
-        )
 
-    def get_call_first_args(self) -> str:
-        return self._node.args[0].s  # type: ignore
+class FieldAST(NamedTuple):
+    """Arguments of a field call, `verbose_name` includes the positional one."""
 
-
-class FieldAST(DisableCommentProtocol, FieldASTProtocol):
-    def __init__(
-        self, node: ast.Assign, field: models.Field, source_provider: SourceProvider
-    ):
-        self._node = node
-        self._field = field
-        self._source_provider = source_provider
-
-    @cached_property
-    def _args(self) -> list[ast.expr]:
-        return self._node.value.args  # type: ignore
-
-    @cached_property
-    def _kwargs(self) -> dict[str, ast.keyword]:
-        return {kw.arg: kw for kw in self._node.value.keywords if kw.arg}  # type: ignore
+    lineno: int
+    args: dict[str, ArgAST]
+    source_provider: SourceProvider
 
     def get_arg(self, name: str) -> Optional[ArgASTProtocol]:
-        if name == "verbose_name":
-            return ArgAST(self._verbose_name) if self._verbose_name else None
-        return ArgAST(self._kwargs[name].value) if name in self._kwargs else None
-
-    @cached_property
-    def _verbose_name(self) -> Union[None, ast.Constant, ast.Call]:
-        result = getattr(self._kwargs.get("verbose_name"), "value", None)
-        if result:
-            return result
-        if isinstance(self._field, models.fields.related.RelatedField):
-            return None
-        if self._args:
-            node = self._args[0]
-            if isinstance(node, ast.Call) and hasattr(node.func, "id"):
-                return node
-            elif isinstance(node, (ast.Constant, ast.Str)):
-                return node
-        return None
+        return self.args.get(name)
 
     def is_disabled_by_comment(self, check_id: str) -> bool:
-        return CheckId.find_check(
-            check_id
-        ) in self._source_provider.get_disabled_checks_for_line(self._node.lineno)
+        return self.source_provider.is_disabled_for_line(
+            self.lineno, CheckId.find_check(check_id)
+        )
+
+
+def _get_field_ast(
+    facts: FieldFacts, field: models.Field, source_provider: SourceProvider
+) -> FieldAST:
+    args = {name: ArgAST(*arg) for name, arg in facts.kwargs.items()}
+    if (
+        "verbose_name" not in args
+        and facts.first_arg is not None
+        # the first argument of related fields is the related model
+        and not isinstance(field, models.fields.related.RelatedField)
+    ):
+        args["verbose_name"] = ArgAST(*facts.first_arg)
+    return FieldAST(facts.lineno, args, source_provider)
@@ -1,10 +1,13 @@
 from collections.abc import Iterable
-from typing import Any, Optional, Protocol
+from typing import TYPE_CHECKING, Any, Optional, Protocol
 
-from django.db import models
+if TYPE_CHECKING:
+    from django.db import models
 
 
 class ArgASTProtocol(Protocol):
+    __slots__ = ()
+
     @property
     def is_callable(self) -> bool: ...
 
@@ -15,27 +18,40 @@ class ArgASTProtocol(Protocol):
 
 
 class FieldASTProtocol(Protocol):
+    __slots__ = ()
+
     def get_arg(self, name: str) -> Optional[ArgASTProtocol]: ...
 
 
 class ModelASTProtocol(Protocol):
+    __slots__ = ()
+
     @property
     def field_nodes(
         self,
-    ) -> Iterable[tuple[models.fields.Field, "FieldASTDisableCommentProtocol"]]: ...
+    ) -> Iterable[tuple["models.fields.Field", "FieldASTDisableCommentProtocol"]]: ...
+
+    @property
+    def inherited_field_nodes(
+        self,
+    ) -> Iterable[tuple["models.fields.Field", "FieldASTDisableCommentProtocol"]]: ...
 
     def has_meta_var(self, name: str) -> bool: ...
 
 
 class DisableCommentProtocol(Protocol):
+    __slots__ = ()
+
     def is_disabled_by_comment(self, check_id: str) -> bool: ...
 
 
 class ModelASTDisableCommentProtocol(
     ModelASTProtocol, DisableCommentProtocol, Protocol
-): ...
+):
+    __slots__ = ()
 
 
 class FieldASTDisableCommentProtocol(
     FieldASTProtocol, DisableCommentProtocol, Protocol
-): ...
+):
+    __slots__ = ()
@@ -0,0 +1,227 @@
+"""Facts about classes extracted from source, cached on disk by content digest.
+
+Facts don't depend on checks configuration, runs with changed options reuse
+them and parse only files changed since the facts were stored.
+"""
+
+import ast
+import base64
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+from collections.abc import Iterable
+from typing import Any, NamedTuple, Optional
+
+from extra_checks.check_id import CheckId
+from extra_checks.daemon import DaemonClient
+from extra_checks.utils import get_version
+
+FACTS_VERSION = 2
+_CHECK_NAMES = ",".join(c.name for c in CheckId)
+
+# (is_callable, callable_func_name, value) of a call argument
+ArgFacts = tuple[bool, Optional[str], Any]
+
+
+class FieldFacts(NamedTuple):
+    lineno: int
+    kwargs: dict[str, ArgFacts]
+    # constant or named call passed as the first positional argument
+    first_arg: Optional[ArgFacts]
+
+
+class ClassFacts(NamedTuple):
+    # line of the first decorator or of the class statement
+    lineno: int
+    meta_lineno: Optional[int]
+    meta_vars: frozenset[str]
+    # assignments of calls in the class body by name
+    fields: dict[str, FieldFacts]
+
+
+class ModuleFacts(NamedTuple):
+    disabled_checks: dict[int, int]
+    classes: tuple[ClassFacts, ...]
+    # indexes of classes by qualified name and by the first line
+    by_name: dict[str, int]
+    by_line: dict[int, int]
+
+
+def _get_assignments(nodes: Iterable[ast.AST]) -> dict[str, ast.Assign]:
+    result = {}
+    for node in nodes:
+        if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name):
+            result[node.targets[0].id] = node
+    return result
+
+
+def _get_arg_facts(node: ast.expr) -> ArgFacts:
+    if isinstance(node, ast.Call):
+        first = node.args[0] if node.args else None
+        return (
+            True,
+            getattr(node.func, "id", None),
+            first.value if isinstance(first, ast.Constant) else None,
+        )
+    return (False, None, node.value if isinstance(node, ast.Constant) else None)
+
+
+def _get_field_facts(node: ast.Assign, call: ast.Call) -> FieldFacts:
+    first_arg = None
+    if call.args:
+        first = call.args[0]
+        if (isinstance(first, ast.Call) and hasattr(first.func, "id")) or isinstance(
+            first, ast.Constant
+        ):
+            first_arg = _get_arg_facts(first)
+    return FieldFacts(
+        node.lineno,
+        {kw.arg: _get_arg_facts(kw.value) for kw in call.keywords if kw.arg},
+        first_arg,
+    )
+
+
+def get_first_lineno(node: ast.ClassDef) -> int:
+    """Return line of the first decorator, comments above it apply to the class."""
+    return node.decorator_list[0].lineno if node.decorator_list else node.lineno
+
+
+def get_class_facts(node: ast.ClassDef) -> ClassFacts:
+    meta = None
+    for child in node.body:
+        if isinstance(child, ast.ClassDef) and child.name == "Meta":
+            meta = child
+            break
+    return ClassFacts(
+        get_first_lineno(node),
+        meta.lineno if meta else None,
+        frozenset(_get_assignments(meta.body)) if meta else frozenset(),
+        {
+            name: _get_field_facts(assign, assign.value)
+            for name, assign in _get_assignments(node.body).items()
+            if isinstance(assign.value, ast.Call)
+        },
+    )
+
+
+def get_module_facts(
+    disabled_checks: dict[int, int],
+    by_name: dict[str, ast.ClassDef],
+    by_line: dict[int, ast.ClassDef],
+) -> ModuleFacts:
+    nodes = {id(n): n for n in (*by_name.values(), *by_line.values())}
+    index = {key: i for i, key in enumerate(nodes)}
+    return ModuleFacts(
+        disabled_checks,
+        tuple(get_class_facts(n) for n in nodes.values()),
+        {name: index[id(n)] for name, n in by_name.items()},
+        {line: index[id(n)] for line, n in by_line.items()},
+    )
+
+
+def _dumps(facts: ModuleFacts) -> bytes:
+    # marshal doesn't support subclasses of tuple
+    return marshal.dumps(
+        (
+            facts.disabled_checks,
+            tuple(
+                (
+                    c.lineno,
+                    c.meta_lineno,
+                    c.meta_vars,
+                    {name: tuple(f) for name, f in c.fields.items()},
+                )
+                for c in facts.classes
+            ),
+            facts.by_name,
+            facts.by_line,
+        )
+    )
+
+
+def _loads(data: bytes) -> ModuleFacts:
+    disabled_checks, classes, by_name, by_line = marshal.loads(data)
+    return ModuleFacts(
+        disabled_checks,
+        tuple(
+            ClassFacts(
+                lineno,
+                meta_lineno,
+                meta_vars,
+                {name: FieldFacts(*f) for name, f in fields.items()},
+            )
+            for lineno, meta_lineno, meta_vars, fields in classes
+        ),
+        by_name,
+        by_line,
+    )
+
+
+class SourceFactsCache:
+    """Directory of module facts, entries are keyed by digest of the source.
+
+    The key includes python and package versions, the directory can be
+    shared between machines.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+
+    def _key(self, digest: str) -> str:
+        # masks of disabled checks depend on the order of check ids
+        return hashlib.sha256(
+            f"{FACTS_VERSION}:{sys.implementation.cache_tag}:{get_version()}:"
+            f"{_CHECK_NAMES}:{digest}".encode()
+        ).hexdigest()
+
+    def _path(self, digest: str) -> str:
+        key = self._key(digest)
+        return os.path.join(self.directory, key[:2], f"{key}.marshal")
+
+    def get(self, digest: str) -> Optional[ModuleFacts]:
+        try:
+            with open(self._path(digest), "rb") as f:
+                return _loads(f.read())
+        except (OSError, ValueError, EOFError, TypeError):
+            return None
+
+    def set(self, digest: str, facts: ModuleFacts) -> None:
+        path = self._path(digest)
+        try:
+            data = _dumps(facts)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except (OSError, ValueError):
+            pass
+
+
+class SocketFactsCache(SourceFactsCache):
+    """Module facts kept in memory by `extra_checks.daemon`.
+
+    Facts are parsed from source while the daemon isn't available.
+    """
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path)
+        self.client = DaemonClient(path)
+
+    def get(self, digest: str) -> Optional[ModuleFacts]:
+        values = self.client.get_many("facts", [self._key(digest)])
+        if not values or not isinstance(values[0], str):
+            return None
+        try:
+            return _loads(base64.b64decode(values[0]))
+        except (ValueError, EOFError, TypeError):
+            return None
+
+    def set(self, digest: str, facts: ModuleFacts) -> None:
+        try:
+            data = base64.b64encode(_dumps(facts)).decode()
+        except ValueError:
+            return
+        self.client.set_many("facts", [(self._key(digest), data)])
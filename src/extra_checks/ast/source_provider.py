@@ -1,10 +1,25 @@
+import ast
+import hashlib
 import inspect
+import linecache
+import os
 import re
-import textwrap
-from collections.abc import Iterable
-from typing import TYPE_CHECKING, Optional
+import sys
+import tokenize
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Optional
 
-from extra_checks.check_id import ALL_CHECKS_NAMES, CheckId
+from extra_checks.check_id import ALL_CHECKS_MASK, CheckId
+from extra_checks.profiling import profiler
+
+from .source_facts import (
+    ClassFacts,
+    ModuleFacts,
+    SourceFactsCache,
+    get_first_lineno,
+    get_module_facts,
+)
 
 if TYPE_CHECKING:
     cached_property = property
@@ -13,21 +28,24 @@ else:
 
 
 DISABLE_COMMENT_PATTERN = r"^#\s*extra-checks-disable-next-line(?:\s+(.*))?$"
+NO_CHECKS = 0
+_UNSET: Any = object()
 
 
-def _parse_comment(checks: Optional[str]) -> set[str]:
+def _parse_comment(checks: Optional[str]) -> int:
+    """Return mask of checks listed in the comment."""
     if not checks:
-        return ALL_CHECKS_NAMES  # type: ignore
-    result = set()
+        return ALL_CHECKS_MASK
+    result = NO_CHECKS
     for scheck in checks.split(","):
         check = CheckId.find_check(scheck.strip())
         if check:
-            result.add(check.value)
+            result |= check.bit
     return result
 
 
-def _find_disabled_checks(comments: Iterable[str]) -> set[str]:
-    result = set()
+def _find_disabled_checks(comments: Iterable[str]) -> int:
+    result = NO_CHECKS
     for line in comments:
         m = re.match(DISABLE_COMMENT_PATTERN, line)
         if m:
@@ -35,37 +53,270 @@ def _find_disabled_checks(comments: Iterable[str]) -> set[str]:
     return result
 
 
-class SourceProvider:
-    def __init__(self, obj: type) -> None:
-        self._obj = obj
-        self._comments_cache: dict[int, set[str]] = {}
+def _find_comment_lines(lines: list[str]) -> dict[int, str]:
+    """Return comments that occupy whole lines by line number."""
+    result = {}
+    try:
+        for token in tokenize.generate_tokens(iter(lines).__next__):
+            if (
+                token.type == tokenize.COMMENT
+                and not token.line[: token.start[1]].strip()
+            ):
+                result[token.start[0]] = token.string
+    except (tokenize.TokenError, SyntaxError):
+        return {
+            i: line.strip()
+            for i, line in enumerate(lines, 1)
+            if line.lstrip().startswith("#")
+        }
+    return result
+
+
+def _index_classes(
+    node: ast.AST,
+    prefix: str,
+    by_name: dict[str, ast.ClassDef],
+    by_line: dict[int, ast.ClassDef],
+) -> None:
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, ast.ClassDef):
+            qualname = prefix + child.name
+            by_name.setdefault(qualname, child)
+            # __firstlineno__ (python 3.13+) points to the first decorator
+            by_line.setdefault(get_first_lineno(child), child)
+            _index_classes(child, qualname + ".", by_name, by_line)
+        elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            _index_classes(child, f"{prefix}{child.name}.<locals>.", by_name, by_line)
+        else:
+            _index_classes(child, prefix, by_name, by_line)
+
+
+def _stat(filename: str) -> Optional[tuple[int, int]]:
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ModuleSource:
+    """Source of a python file, parsed once and shared by all its classes."""
+
+    def __init__(
+        self,
+        filename: str,
+        lines: list[str],
+        facts_cache: Optional[SourceFactsCache] = None,
+    ) -> None:
+        self.filename = filename
+        self._lines: Optional[list[str]] = lines
+        self.facts_cache = facts_cache
+
+    @property
+    def lines(self) -> list[str]:
+        """Lines of the file, read again if needed after `release`."""
+        if self._lines is None:
+            self._lines = linecache.getlines(self.filename)
+        return self._lines
 
     @cached_property
-    def source(self) -> Optional[str]:
+    def digest(self) -> str:
+        return hashlib.sha256("".join(self.lines).encode()).hexdigest()
+
+    @cached_property
+    def tree(self) -> ast.Module:
+        return profiler.call(
+            "source", "ast.parse", ast.parse, "".join(self.lines), self.filename
+        )
+
+    @cached_property
+    def _classes(self) -> tuple[dict[str, ast.ClassDef], dict[int, ast.ClassDef]]:
+        by_name: dict[str, ast.ClassDef] = {}
+        by_line: dict[int, ast.ClassDef] = {}
+        _index_classes(self.tree, "", by_name, by_line)
+        return by_name, by_line
+
+    def find_class(self, cls: type) -> Optional[ast.ClassDef]:
+        by_name, by_line = self._classes
+        lineno = getattr(cls, "__firstlineno__", None)
+        if lineno in by_line:
+            return by_line[lineno]
+        return by_name.get(cls.__qualname__)
+
+    @cached_property
+    def facts(self) -> ModuleFacts:
+        """Facts about classes of the module, loaded from `facts_cache` if stored."""
+        if self.facts_cache is not None:
+            facts = profiler.call(
+                "source", "facts.load", self.facts_cache.get, self.digest
+            )
+            if facts is not None:
+                self.__dict__.setdefault("_disabled_checks", facts.disabled_checks)
+                return facts
+        facts = profiler.call(
+            "source",
+            "facts",
+            get_module_facts,
+            self._disabled_checks,
+            *self._classes,
+        )
+        if self.facts_cache is not None:
+            self.facts_cache.set(self.digest, facts)
+        return facts
+
+    def find_class_facts(self, cls: type) -> Optional[ClassFacts]:
+        facts = self.facts
+        lineno = getattr(cls, "__firstlineno__", None)
+        if lineno in facts.by_line:
+            return facts.classes[facts.by_line[lineno]]
+        index = facts.by_name.get(cls.__qualname__)
+        return None if index is None else facts.classes[index]
+
+    @cached_property
+    def _disabled_checks(self) -> dict[int, int]:
+        return profiler.call("source", "comments", self._find_disabled_checks)
+
+    def _find_disabled_checks(self) -> dict[int, int]:
+        """Map lines to mask of checks disabled by the block of comments right above them."""
+        result = {}
+        comments = _find_comment_lines(self.lines)
+        block: list[str] = []
+        for line_no in sorted(comments):
+            block.append(comments[line_no])
+            if line_no + 1 not in comments:
+                disabled = _find_disabled_checks(block)
+                if disabled:
+                    result[line_no + 1] = disabled
+                block = []
+        return result
+
+    def get_disabled_checks_for_line(self, line_no: int) -> int:
+        return self._disabled_checks.get(line_no, NO_CHECKS)
+
+    def release(self) -> None:
+        """Drop the syntax tree and source, they are loaded again if needed.
+
+        Digest and facts, including disabled checks, are kept.
+        """
+        self.__dict__.pop("tree", None)
+        self.__dict__.pop("_classes", None)
+        # sources of loaders (e.g. zip imports) can't be read by file name
+        if os.path.isfile(self.filename):
+            self._lines = None
+            linecache.cache.pop(self.filename, None)
+
+    def is_disabled_for_line(self, line_no: int, check: Optional[CheckId]) -> bool:
+        return check is not None and bool(
+            self.get_disabled_checks_for_line(line_no) & check.bit
+        )
+
+
+class SourceStore:
+    """Sources of modules shared by checks runs in the process.
+
+    `revalidate` drops sources of files changed since they were loaded,
+    facts of modules loaded with `facts_cache` set are stored in it.
+    """
+
+    def __init__(self) -> None:
+        self.facts_cache: Optional[SourceFactsCache] = None
+        self._modules: dict[str, Optional[ModuleSource]] = {}
+        self._stats: dict[str, Optional[tuple[int, int]]] = {}
+        self._filenames: dict[str, str] = {}
+
+    def get_module(self, obj: type) -> Optional[ModuleSource]:
         try:
-            return textwrap.dedent(inspect.getsource(self._obj))
-        except (TypeError, OSError):
-            # TODO: add warning?
+            filename = inspect.getsourcefile(obj)
+        except TypeError:
             return None
+        if not filename:
+            return None
+        if filename not in self._modules:
+            self._filenames[obj.__module__] = filename
+            module = sys.modules.get(obj.__module__)
+            self._stats[filename] = _stat(filename)
+            linecache.checkcache(filename)
+            lines = profiler.call(
+                "source",
+                "load",
+                linecache.getlines,
+                filename,
+                module.__dict__ if module else None,
+            )
+            self._modules[filename] = (
+                ModuleSource(filename, lines, self.facts_cache) if lines else None
+            )
+        return self._modules[filename]
 
-    @cached_property
-    def _top_comments(self) -> Iterable[str]:
-        for line in (inspect.getcomments(self._obj) or "").splitlines()[::-1]:
-            yield line.strip()
-
-    def _get_line_comments(self, line_no: int) -> Iterable[str]:
-        line_no -= 2
-        if line_no < 0:
-            yield from self._top_comments
-        for line in (self.source or "").splitlines()[line_no::-1]:
-            sline = line.strip()
-            if sline.startswith("#"):
-                yield sline
-            else:
-                break
-
-    def get_disabled_checks_for_line(self, line_no: int) -> set[str]:
-        if line_no not in self._comments_cache:
-            comments = self._get_line_comments(line_no)
-            self._comments_cache[line_no] = _find_disabled_checks(comments)
-        return self._comments_cache[line_no]
+    def revalidate(self) -> None:
+        for filename, stat in list(self._stats.items()):
+            if _stat(filename) != stat:
+                del self._modules[filename]
+                del self._stats[filename]
+                linecache.checkcache(filename)
+
+    def release(self, module_name: str) -> None:
+        """Release syntax tree and source of the module, its digest is kept."""
+        filename = self._filenames.get(module_name)
+        module = self._modules.get(filename) if filename else None
+        if module is not None:
+            module.release()
+
+    def clear(self) -> None:
+        self._modules.clear()
+        self._stats.clear()
+        self._filenames.clear()
+
+
+source_store = SourceStore()
+
+
+def release_sources(objects: Iterable[type]) -> Iterator[type]:
+    """Yield objects, source of a module is released once its last object is handled."""
+    objects = list(objects)
+    remaining = Counter(obj.__module__ for obj in objects)
+    for obj in objects:
+        yield obj
+        remaining[obj.__module__] -= 1
+        if not remaining[obj.__module__]:
+            source_store.release(obj.__module__)
+
+
+class SourceProvider:
+    __slots__ = ("_facts", "_module", "_node", "_obj")
+
+    def __init__(self, obj: type) -> None:
+        self._obj = obj
+        self._module: Any = _UNSET
+        self._node: Any = _UNSET
+        self._facts: Any = _UNSET
+
+    @property
+    def module(self) -> Optional[ModuleSource]:
+        if self._module is _UNSET:
+            self._module = source_store.get_module(self._obj)
+        return self._module
+
+    @property
+    def node(self) -> Optional[ast.ClassDef]:
+        if self._node is _UNSET:
+            module = self.module
+            self._node = module.find_class(self._obj) if module else None
+        return self._node
+
+    @property
+    def facts(self) -> Optional[ClassFacts]:
+        if self._facts is _UNSET:
+            module = self.module
+            self._facts = module.find_class_facts(self._obj) if module else None
+        return self._facts
+
+    def get_disabled_checks_for_line(self, line_no: int) -> int:
+        module = self.module
+        if module is None:
+            return NO_CHECKS
+        return module.get_disabled_checks_for_line(line_no)
+
+    def is_disabled_for_line(self, line_no: int, check: Optional[CheckId]) -> bool:
+        module = self.module
+        return module is not None and module.is_disabled_for_line(line_no, check)
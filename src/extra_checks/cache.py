@@ -0,0 +1,245 @@
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+import django
+import django.apps
+import django.core.checks
+
+from .ast.source_provider import source_store
+from .daemon import SOCKET_TIMEOUT, DaemonClient, ResultStore
+from .records import MessageRecord, to_records
+from .utils import get_version
+
+if TYPE_CHECKING:
+    from .checks.base_checks import BaseCheck
+    from .registry import ChecksConfig
+
+CACHE_VERSION = 1
+
+
+def _normalize(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, dict):
+        return sorted([_normalize(k), _normalize(v)] for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_normalize(v) for v in value), key=repr)
+    if hasattr(value, "__qualname__"):
+        name = f"{value.__module__}.{value.__qualname__}"
+        if isinstance(value, type):
+            return name
+        # functions, e.g. `skipif`, change with the source of their module
+        module = source_store.get_module(value)
+        return [name, module.digest if module else None]
+    return str(value)
+
+
+def _sources(classes: Iterable[type]) -> list[tuple[str, str]]:
+    """Return (module, content digest) of the files where classes are defined."""
+    result = set()
+    for cls in classes:
+        module = source_store.get_module(cls)
+        if module is not None:
+            result.add((cls.__module__, module.digest))
+    return sorted(result)
+
+
+def _fingerprint(checks: Iterable["BaseCheck"], config: "ChecksConfig") -> str:
+    rest_framework = sys.modules.get("rest_framework")
+    data = [
+        CACHE_VERSION,
+        get_version(),
+        django.get_version(),
+        getattr(rest_framework, "VERSION", None),
+        _normalize(config.checks),
+        _normalize(config.include_apps),
+        _normalize(config.exclude_apps),
+        _normalize(config.ignored_objects),
+        _normalize(config.ignore.rules),
+        sorted(
+            [c.Id.value, _normalize(type(c)), _normalize(c.cache_key())] for c in checks
+        ),
+        _sources(cls for c in checks for cls in type(c).__mro__),
+    ]
+    return hashlib.sha256(json.dumps(data).encode()).hexdigest()
+
+
+class ResultCache:
+    """On-disk cache of check messages produced for a class.
+
+    Entries are keyed by the content of the source files the class depends
+    on and by the checks configuration, so the directory can be shared
+    between machines.
+    """
+
+    def __init__(self, directory: str, fingerprint: str) -> None:
+        self.directory = directory
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def create(
+        cls, checks: Iterable["BaseCheck"], config: "ChecksConfig"
+    ) -> Optional["ResultCache"]:
+        if not (config.cache_socket or config.cache_dir or config.memoize):
+            return None
+        fingerprint = _fingerprint(checks, config)
+        cache: Optional[ResultCache] = None
+        if config.cache_socket:
+            cache = SocketResultCache(config.cache_socket, fingerprint)
+        elif config.cache_dir:
+            cache = cls(config.cache_dir, fingerprint)
+        if config.memoize:
+            return MemoResultCache(fingerprint, cache)
+        return cache
+
+    def key(self, obj: type, dependencies: Iterable[type] = ()) -> str:
+        data = [
+            self.fingerprint,
+            _normalize(obj),
+            _sources([*obj.__mro__, *dependencies]),
+        ]
+        return hashlib.sha256(json.dumps(data).encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def prefetch(self, keys: Sequence[str]) -> None:
+        """Load entries of a run at once, entries are read one by one by default."""
+
+    def flush(self) -> None:
+        """Store entries set during a run, entries are written on `set` by default."""
+
+    def remember(self, key: str, records: list[MessageRecord]) -> None:
+        """Keep records that a worker process got from the cache."""
+
+    def get(self, key: str) -> Optional[list[MessageRecord]]:
+        try:
+            with open(self._path(key)) as f:
+                return [MessageRecord(*r) for r in json.load(f)]
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def set(self, key: str, records: list[MessageRecord]) -> None:
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(records, f)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+    def run(
+        self,
+        key: str,
+        obj: type,
+        produce: Callable[[], Iterable[django.core.checks.CheckMessage]],
+    ) -> Iterator[django.core.checks.CheckMessage]:
+        cached = self.get(key)
+        if cached is not None:
+            for record in cached:
+                yield record.to_message(obj)
+            return
+        messages = list(produce())
+        records = to_records(messages, obj)
+        if records is not None:
+            self.set(key, records)
+        yield from messages
+
+
+class SocketResultCache(ResultCache):
+    """Cache of check messages kept in memory by `extra_checks.daemon`.
+
+    Entries of a run are fetched in one request and stored in one request on
+    `flush`. Checks run as without cache if the daemon isn't available.
+    """
+
+    def __init__(
+        self, path: str, fingerprint: str, timeout: float = SOCKET_TIMEOUT
+    ) -> None:
+        super().__init__(path, fingerprint)
+        self.client = DaemonClient(path, timeout)
+        self._fetched: dict[str, Any] = {}
+        self._pending: list[tuple[str, list[MessageRecord]]] = []
+
+    def prefetch(self, keys: Sequence[str]) -> None:
+        keys = [key for key in keys if key not in self._fetched]
+        values = self.client.get_many("results", keys) if keys else None
+        if values is not None:
+            self._fetched.update(zip(keys, values))
+
+    def get(self, key: str) -> Optional[list[MessageRecord]]:
+        if key not in self._fetched:
+            self.prefetch([key])
+        value = self._fetched.pop(key, None)
+        if value is None:
+            return None
+        try:
+            return [MessageRecord(*r) for r in value]
+        except TypeError:
+            return None
+
+    def set(self, key: str, records: list[MessageRecord]) -> None:
+        self._pending.append((key, records))
+
+    def flush(self) -> None:
+        pending, self._pending = self._pending, []
+        self.client.set_many("results", pending)
+
+
+class MemoResultCache(ResultCache):
+    """Cache of check messages in memory of the process.
+
+    Results are reused by repeated checks runs in the same interpreter until
+    the config or sources of the class change, other cache is used on misses.
+    Least recently used results are dropped, all of them when django apps are
+    populated again.
+    """
+
+    _memo = ResultStore()
+    # app configs of django the results were produced with
+    _app_configs: Optional[dict[str, Any]] = None
+
+    def __init__(self, fingerprint: str, cache: Optional[ResultCache] = None) -> None:
+        super().__init__("", fingerprint)
+        self.cache = cache
+        app_configs = django.apps.apps.app_configs
+        if MemoResultCache._app_configs is not app_configs:
+            MemoResultCache._app_configs = app_configs
+            self.clear()
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._memo.clear()
+
+    def get(self, key: str) -> Optional[list[MessageRecord]]:
+        records = self._memo.get(key)
+        if records is None and self.cache is not None:
+            records = self.cache.get(key)
+            if records is not None:
+                self._memo.set(key, records)
+        return records
+
+    def set(self, key: str, records: list[MessageRecord]) -> None:
+        self._memo.set(key, records)
+        if self.cache is not None:
+            self.cache.set(key, records)
+
+    def remember(self, key: str, records: list[MessageRecord]) -> None:
+        self._memo.set(key, records)
+
+    def prefetch(self, keys: Sequence[str]) -> None:
+        if self.cache is not None:
+            self.cache.prefetch([key for key in keys if self._memo.get(key) is None])
+
+    def flush(self) -> None:
+        if self.cache is not None:
+            self.cache.flush()
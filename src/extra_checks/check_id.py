@@ -1,5 +1,6 @@
 import enum
-from typing import Optional, cast
+from collections.abc import Iterable
+from typing import Optional
 
 
 class CheckId(str, enum.Enum):
@@ -24,17 +25,33 @@ class CheckId(str, enum.Enum):
     X301 = "drf-model-serializer-extra-kwargs"
     X302 = "drf-model-serializer-meta-attribute"
 
+    @property
+    def bit(self) -> int:
+        """Bit of the check in masks of checks, by order of definition."""
+        return _BITS[self]
+
     @classmethod
     def find_check(cls, value: str) -> Optional["CheckId"]:
-        try:
-            return cls(value)
-        except ValueError:
-            pass
-        try:
-            return cast(CheckId, cls._member_map_[value])
-        except KeyError:
-            pass
-        return None
+        """Find check by its id (e.g. `field-null`) or code (e.g. `X057`)."""
+        if isinstance(value, CheckId):
+            return value
+        return _CHECKS.get(value)
+
+
+_BITS = {c: 1 << i for i, c in enumerate(CheckId)}
+_CHECKS: dict[str, CheckId] = {
+    **{c.name: c for c in CheckId},
+    **{c.value: c for c in CheckId},
+}
+
+
+def to_mask(checks: Iterable[CheckId]) -> int:
+    result = 0
+    for check in checks:
+        result |= check.bit
+    return result
 
 
+# kept for compatibility, use `CheckId.find_check`
 ALL_CHECKS_NAMES = frozenset(CheckId._value2member_map_.keys())
+ALL_CHECKS_MASK = to_mask(CheckId)
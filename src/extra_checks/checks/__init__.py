@@ -1,8 +1,33 @@
-from .model_checks import *  # noqa
-from .model_field_checks import *  # noqa
-from .self_checks import *  # noqa
+"""Check modules are imported on demand by the registry.
 
-try:
+Names of the check modules are still available from this package, the module
+that defines a name is imported on first access.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
     from .drf_serializer_checks import *  # noqa
-except ImportError:
-    pass
+    from .model_checks import *  # noqa
+    from .model_field_checks import *  # noqa
+    from .self_checks import *  # noqa
+
+_MODULES = [
+    "model_checks",
+    "model_field_checks",
+    "self_checks",
+    "drf_serializer_checks",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if not name.startswith("_"):
+        for module_name in _MODULES:
+            try:
+                module = importlib.import_module(f"{__name__}.{module_name}")
+            except ImportError:
+                continue
+            if hasattr(module, name):
+                return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
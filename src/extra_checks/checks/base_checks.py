@@ -6,13 +6,16 @@ from typing import (
     Any,
     Callable,
     ClassVar,
+    NamedTuple,
     Optional,
+    Union,
 )
 
 import django.core.checks
 
 from .. import CheckId, forms
 from ..ast.protocols import DisableCommentProtocol
+from ..profiling import profiler
 
 MESSAGE_MAP = {
     django.core.checks.DEBUG: django.core.checks.Debug,
@@ -23,6 +26,27 @@ MESSAGE_MAP = {
 }
 
 
+class PendingMessage(NamedTuple):
+    """Message of a check, turned into `CheckMessage` unless disabled by comment."""
+
+    check: "BaseCheck"
+    msg: str
+    hint: Optional[str]
+    obj: Any
+
+    def to_message(self) -> django.core.checks.CheckMessage:
+        check = self.check
+        return MESSAGE_MAP[check.level](
+            self.msg + f" [{check.Id.value}]",
+            hint=self.hint,
+            obj=self.obj,
+            id=check.Id.name,
+        )
+
+
+Message = Union[django.core.checks.CheckMessage, PendingMessage]
+
+
 class BaseCheck(ABC):
     Id: CheckId
     settings_form_class: ClassVar[type[forms.BaseCheckForm]] = forms.BaseCheckForm
@@ -46,27 +70,55 @@ class BaseCheck(ABC):
     def __call__(
         self, obj: Any, ast: Optional[DisableCommentProtocol] = None, **kwargs: Any
     ) -> Iterator[django.core.checks.CheckMessage]:
-        if not self.is_ignored(obj):
-            for error in self.apply(obj, ast=ast, **kwargs):
-                if not ast or (error.id and not ast.is_disabled_by_comment(error.id)):
-                    yield error
+        if profiler.enabled:
+            yield from profiler.iterate(
+                "check", self.Id.name, self._check(obj, ast, **kwargs)
+            )
+        else:
+            yield from self._check(obj, ast, **kwargs)
+
+    def _check(
+        self, obj: Any, ast: Optional[DisableCommentProtocol], **kwargs: Any
+    ) -> Iterator[django.core.checks.CheckMessage]:
+        if self.is_ignored(obj):
+            return
+        disabled = None
+        for message in self.apply(obj, ast=ast, **kwargs):
+            if isinstance(message, PendingMessage):
+                # messages of the check are disabled by the same comment
+                if disabled is None:
+                    disabled = bool(ast and self._is_disabled(ast, self.Id))
+                if not disabled:
+                    yield message.to_message()
+            elif not ast or (message.id and not self._is_disabled(ast, message.id)):
+                yield message
+
+    def _is_disabled(self, ast: DisableCommentProtocol, check_id: str) -> bool:
+        return profiler.call(
+            "ast", "is_disabled_by_comment", ast.is_disabled_by_comment, check_id
+        )
+
+    def is_skipped(self, obj: Any) -> bool:
+        return bool(
+            self.skipif and profiler.call("skipif", self.Id.name, self.skipif, obj)
+        )
 
     def is_ignored(self, obj: Any) -> bool:
-        if self.skipif and self.skipif(obj):
+        if self.is_skipped(obj):
             return True
         return obj in self.ignore_objects or type(obj) in self.ignore_types
 
+    def cache_key(self) -> Any:
+        """Return extra state the check results depend on besides the source."""
+        return None
+
     def message(
         self, message: str, hint: Optional[str] = None, obj: Any = None
-    ) -> django.core.checks.CheckMessage:
-        return MESSAGE_MAP[self.level](
-            message + f" [{self.Id.value}]", hint=hint, obj=obj, id=self.Id.name
-        )
+    ) -> PendingMessage:
+        return PendingMessage(self, message, hint, obj)
 
     @abstractmethod
-    def apply(
-        self, *args: Any, **kwargs: Any
-    ) -> Iterator[django.core.checks.CheckMessage]:
+    def apply(self, *args: Any, **kwargs: Any) -> Iterator[Message]:
         raise NotImplementedError()
 
 
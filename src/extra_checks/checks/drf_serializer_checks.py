@@ -1,25 +1,34 @@
-import importlib
-import site
+import ast
 from abc import abstractmethod
 from collections.abc import Iterable, Iterator
+from functools import partial
+from itertools import chain
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Optional,
     Union,
     cast,
 )
 
 import django.core.checks
+from django.db.models import Model
 from rest_framework.serializers import ModelSerializer, Serializer
 
+from .. import runner
+from ..app_index import AppIndex
 from ..ast.protocols import DisableCommentProtocol
-from ..ast.source_provider import SourceProvider
+from ..ast.source_facts import get_first_lineno
+from ..ast.source_provider import SourceProvider, source_store
+from ..cache import ResultCache
 from ..check_id import CheckId
 from ..forms import AttrsForm
+from ..ignore import IgnoreRules
 from ..registry import ChecksConfig, registry
 from ..utils import collect_subclasses
-from .base_checks import BaseCheck
+from ..vcs import get_changed_files, is_changed
+from .base_checks import BaseCheck, Message
 
 if TYPE_CHECKING:
     cached_property = property
@@ -36,72 +45,133 @@ class DisableCommentProvider(DisableCommentProtocol):
         return SourceProvider(self.serializer_class)
 
     def _get_line(self) -> Optional[int]:
-        return 1
+        node = self._source_provider.node
+        return get_first_lineno(node) if node else None
 
     def is_disabled_by_comment(self, check_id: str) -> bool:
         check = CheckId.find_check(check_id)
         line = self._get_line()
-        return (
-            line is not None
-            and check in self._source_provider.get_disabled_checks_for_line(line)
+        return line is not None and self._source_provider.is_disabled_for_line(
+            line, check
         )
 
 
 class DisableMetaCommentProvider(DisableCommentProvider):
     def _get_line(self) -> Optional[int]:
-        lines = (self._source_provider.source or "").splitlines()
-        # find line starting with `class Meta` and lowest indent
-        try:
-            return sorted(
-                (
-                    (i, line)
-                    for i, line in enumerate(lines, 1)
-                    if line.strip().startswith(("class Meta(", "class Meta:"))
-                ),
-                key=lambda a: a[1].find("class Meta"),
-            )[0][0]
-        except (StopIteration, IndexError):
+        node = self._source_provider.node
+        if node is None:
             return None
+        for child in node.body:
+            if isinstance(child, ast.ClassDef) and child.name == "Meta":
+                return child.lineno
+        return None
+
+
+def _get_module_filter(
+    include_apps: Optional[Iterable[str]],
+    app_configs: Optional[list[Any]],
+    app_index: AppIndex,
+) -> Callable[[str], bool]:
+    """Return memoized test of whether serializers of a module are checked."""
+    selected = None if app_configs is None else {a.name for a in app_configs}
+    modules: dict[str, bool] = {}
+
+    def is_included(module_name: str) -> bool:
+        app = app_index.get_app(module_name)
+        if app is not None and app_index.is_excluded(app):
+            return False
+        if include_apps is not None:
+            if app is None or app.name not in include_apps:
+                return False
+        elif app_index.is_third_party_module(module_name):
+            return False
+        return selected is None or (app is not None and app.name in selected)
+
+    def is_module_included(module_name: str) -> bool:
+        try:
+            return modules[module_name]
+        except KeyError:
+            included = modules[module_name] = is_included(module_name)
+            return included
+
+    return is_module_included
 
 
-def _filter_app_serializers(
-    serializers: Iterable[type[Serializer]],
+def _discover_serializers(
     include_apps: Optional[Iterable[str]] = None,
+    app_configs: Optional[list[Any]] = None,
+    app_index: Optional[AppIndex] = None,
+) -> tuple[dict[str, list[type[Serializer]]], dict[str, list[type[ModelSerializer]]]]:
+    """Group serializers and model serializers to check by module.
+
+    The hierarchy is walked once, classes of modules that aren't checked
+    are dropped by a lookup of their module.
+    """
+    is_included = _get_module_filter(include_apps, app_configs, app_index or AppIndex())
+    serializers: dict[str, list[type[Serializer]]] = {}
+    model_serializers: dict[str, list[type[ModelSerializer]]] = {}
+    for cls in collect_subclasses(Serializer.__subclasses__()):
+        if cls is ModelSerializer or not is_included(cls.__module__):
+            continue
+        if issubclass(cls, ModelSerializer):
+            model_serializers.setdefault(cls.__module__, []).append(cls)
+        else:
+            serializers.setdefault(cls.__module__, []).append(cls)
+    return serializers, model_serializers
+
+
+def _filter_changed_serializers(
+    serializers: Iterable[type[Serializer]], changed_files: frozenset[str]
 ) -> Iterator[type[Serializer]]:
-    site_prefixes = set(site.PREFIXES)
-    if include_apps is not None:
-        app_paths = {
-            a.path for a in django.apps.apps.get_app_configs() if a.name in include_apps
-        }
-        for s in serializers:
-            module = importlib.import_module(s.__module__)
-            if any(
-                module.__file__ and module.__file__.startswith(path)
-                for path in app_paths
-            ):
-                yield s
-        return
     for s in serializers:
-        module = importlib.import_module(s.__module__)
-        if not any(
-            module.__file__ and module.__file__.startswith(path)
-            for path in site_prefixes
+        model = getattr(getattr(s, "Meta", None), "model", None)
+        if is_changed(s, changed_files) or (
+            isinstance(model, type) and is_changed(model, changed_files)
         ):
             yield s
 
 
+def _filter_model_serializers(
+    serializers: Iterable[type[Serializer]], models: Iterable[type[Model]]
+) -> Iterator[type[Serializer]]:
+    models = frozenset(models)
+    for s in serializers:
+        if getattr(getattr(s, "Meta", None), "model", None) in models:
+            yield s
+
+
 def _get_serializers_to_check(
     include_apps: Optional[Iterable[str]] = None,
+    changed_files: Optional[frozenset[str]] = None,
+    app_configs: Optional[list[Any]] = None,
+    app_index: Optional[AppIndex] = None,
+    models: Optional[Iterable[type[Model]]] = None,
 ) -> tuple[Iterator[type[Serializer]], Iterator[type[ModelSerializer]]]:
-    serializer_classes = _filter_app_serializers(
-        collect_subclasses(
-            s for s in Serializer.__subclasses__() if s is not ModelSerializer
-        ),
-        include_apps,
+    """Return serializers and model serializers to check.
+
+    If `models` are given only model serializers of these models are checked.
+    """
+    serializers, model_serializers = _discover_serializers(
+        include_apps, app_configs, app_index
+    )
+    serializer_classes: Iterator[type[Serializer]] = chain.from_iterable(
+        serializers.values()
     )
-    model_serializer_classes = _filter_app_serializers(
-        collect_subclasses(ModelSerializer.__subclasses__()), include_apps
+    model_serializer_classes: Iterator[type[Serializer]] = chain.from_iterable(
+        model_serializers.values()
     )
+    if models is not None:
+        serializer_classes = iter(())
+        model_serializer_classes = _filter_model_serializers(
+            model_serializer_classes, models
+        )
+    if changed_files is not None:
+        serializer_classes = _filter_changed_serializers(
+            serializer_classes, changed_files
+        )
+        model_serializer_classes = _filter_changed_serializers(
+            model_serializer_classes, changed_files
+        )
     return (
         serializer_classes,
         cast(Iterator[type[ModelSerializer]], model_serializer_classes),
@@ -119,8 +189,10 @@ def check_drf_serializers(
     ],
     config: ChecksConfig,
     app_configs: Optional[list[Any]] = None,
+    models: Optional[Iterable[type[Model]]] = None,
     **kwargs: Any,
 ) -> Iterator[Any]:
+    """Check serializers of `app_configs` or only model serializers of `models`."""
     model_serializer_checks = []
     model_meta_serializer_checks = []
     serializer_checks = []
@@ -131,41 +203,81 @@ def check_drf_serializers(
             model_serializer_checks.append(check)
         else:
             serializer_checks.append(check)
-    s_classes, m_classes = _get_serializers_to_check(config.include_apps)
-    for s in s_classes:
-        comment_provider = DisableCommentProvider(s)
-        for check in serializer_checks:
-            yield from check(s, comment_provider)
-    for s in m_classes:
-        comment_provider = DisableCommentProvider(s)
-        for check in model_serializer_checks:
-            yield from check(s, comment_provider)
-        comment_provider = DisableMetaCommentProvider(s)
-        for check in model_meta_serializer_checks:
-            yield from check(s, comment_provider)
+    source_store.revalidate()
+    cache = ResultCache.create(checks, config)
+    changed_files = (
+        get_changed_files(config.changed_since) if config.changed_since else None
+    )
+    s_classes, m_classes = _get_serializers_to_check(
+        config.include_apps,
+        changed_files,
+        app_configs,
+        config.get_app_index(),
+        models,
+    )
+    yield from runner.run(
+        s_classes,
+        partial(_check_serializer, checks=serializer_checks, ignore=config.ignore),
+        cache=cache,
+    )
+    yield from runner.run(
+        m_classes,
+        partial(
+            _check_model_serializer,
+            checks=model_serializer_checks,
+            meta_checks=model_meta_serializer_checks,
+            ignore=config.ignore,
+        ),
+        cache=cache,
+    )
+
+
+def _check_serializer(
+    serializer: type[Serializer],
+    *,
+    checks: Iterable["CheckDRFSerializer"],
+    ignore: IgnoreRules,
+) -> Iterator[Any]:
+    comment_provider = DisableCommentProvider(serializer)
+    ignored = ignore.resolve(serializer)
+    for check in checks:
+        if check.Id not in ignored:
+            yield from check(serializer, comment_provider)
+
+
+def _check_model_serializer(
+    serializer: type[ModelSerializer],
+    *,
+    checks: Iterable["CheckDRFModelSerializer"],
+    meta_checks: Iterable["CheckDRFModelSerializerMeta"],
+    ignore: IgnoreRules,
+) -> Iterator[Any]:
+    comment_provider = DisableCommentProvider(serializer)
+    ignored = ignore.resolve(serializer)
+    for check in checks:
+        if check.Id not in ignored:
+            yield from check(serializer, comment_provider)
+    comment_provider = DisableMetaCommentProvider(serializer)
+    for meta_check in meta_checks:
+        if meta_check.Id not in ignored:
+            yield from meta_check(serializer, comment_provider)
 
 
 class CheckDRFSerializer(BaseCheck):
     @abstractmethod
-    def apply(
-        self, serializer: Serializer, **kwargs: Any
-    ) -> Iterator[django.core.checks.CheckMessage]:
+    def apply(self, serializer: Serializer, **kwargs: Any) -> Iterator[Message]:
         raise NotImplementedError()
 
 
 class CheckDRFModelSerializerMeta(BaseCheck):
     @abstractmethod
-    def apply(
-        self, serializer: ModelSerializer, **kwargs: Any
-    ) -> Iterator[django.core.checks.CheckMessage]:
+    def apply(self, serializer: ModelSerializer, **kwargs: Any) -> Iterator[Message]:
         raise NotImplementedError()
 
 
 class CheckDRFModelSerializer(BaseCheck):
     @abstractmethod
-    def apply(
-        self, serializer: ModelSerializer, **kwargs: Any
-    ) -> Iterator[django.core.checks.CheckMessage]:
+    def apply(self, serializer: ModelSerializer, **kwargs: Any) -> Iterator[Message]:
         raise NotImplementedError()
 
 
@@ -174,9 +286,7 @@ class CheckDRFSerializerExtraKwargs(CheckDRFModelSerializerMeta):
     Id = CheckId.X301
     level = django.core.checks.ERROR
 
-    def apply(
-        self, serializer: ModelSerializer, **kwargs: Any
-    ) -> Iterator[django.core.checks.CheckMessage]:
+    def apply(self, serializer: ModelSerializer, **kwargs: Any) -> Iterator[Message]:
         if not hasattr(serializer, "Meta") or not hasattr(
             serializer.Meta, "extra_kwargs"
         ):
@@ -199,9 +309,7 @@ class CheckDRFSerializerMetaAttribute(CheckDRFModelSerializerMeta):
         self.attrs = attrs
         super().__init__(**kwargs)
 
-    def apply(
-        self, serializer: ModelSerializer, **kwargs: Any
-    ) -> Iterator[django.core.checks.CheckMessage]:
+    def apply(self, serializer: ModelSerializer, **kwargs: Any) -> Iterator[Message]:
         meta = getattr(serializer, "Meta", None)
         for attr in self.attrs:
             if not hasattr(meta, attr):
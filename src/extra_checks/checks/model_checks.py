@@ -1,20 +1,28 @@
-import site
+import os
 from abc import abstractmethod
 from collections.abc import Iterable, Iterator
+from functools import partial
 from typing import TYPE_CHECKING, Any, Optional, Union
 
 import django.core.checks
 from django import forms
-from django.apps import apps
+from django.apps import AppConfig, apps
 from django.contrib.admin.sites import all_sites
 from django.db import models
 from django.db.models.options import DEFAULT_NAMES as META_ATTRS
 
-from .. import CheckId
+from .. import CheckId, runner
+from ..app_index import AppIndex
 from ..ast import ModelASTProtocol, get_model_ast
+from ..ast.source_facts import SocketFactsCache, SourceFactsCache
+from ..ast.source_provider import source_store
+from ..cache import ResultCache
+from ..facts import facts_store
 from ..forms import AttrsForm, BaseCheckForm
+from ..ignore import IgnoreRules
 from ..registry import ChecksConfig, registry
-from .base_checks import BaseCheck
+from ..vcs import filter_changed_models, get_changed_files
+from .base_checks import BaseCheck, Message
 
 if TYPE_CHECKING:
     from .model_field_checks import CheckModelField
@@ -24,25 +32,87 @@ def _get_models_to_check(
     *,
     app_configs: Optional[list[Any]] = None,
     include_apps: Optional[Iterable[str]] = None,
+    changed_files: Optional[frozenset[str]] = None,
+    models_: Optional[Iterable[type[models.Model]]] = None,
+    app_index: Optional[AppIndex] = None,
 ) -> Iterator[type[models.Model]]:
-    apps = django.apps.apps.get_app_configs() if app_configs is None else app_configs
+    app_index = app_index or AppIndex()
+    models_ = _with_abstract_bases(
+        _get_app_models(app_configs, include_apps, app_index)
+        if models_ is None
+        else iter(models_),
+        app_configs,
+        include_apps,
+        app_index,
+    )
+    if changed_files is None:
+        return models_
+    return filter_changed_models(models_, changed_files)
+
+
+def _is_app_checked(
+    app: AppConfig, include_apps: Optional[Iterable[str]], app_index: AppIndex
+) -> bool:
+    if app_index.is_excluded(app):
+        return False
     if include_apps is not None:
-        for app in apps:
-            if app.name in include_apps:
-                yield from app.get_models()
-        return
+        return app.name in include_apps
+    return not app_index.is_third_party_app(app)
+
+
+def _get_app_models(
+    app_configs: Optional[list[Any]],
+    include_apps: Optional[Iterable[str]],
+    app_index: AppIndex,
+) -> Iterator[type[models.Model]]:
+    apps = django.apps.apps.get_app_configs() if app_configs is None else app_configs
     for app in apps:
-        if not any(app.path.startswith(path) for path in set(site.PREFIXES)):
+        if _is_app_checked(app, include_apps, app_index):
             yield from app.get_models()
 
 
+def _with_abstract_bases(
+    models_: Iterable[type[models.Model]],
+    app_configs: Optional[list[Any]],
+    include_apps: Optional[Iterable[str]],
+    app_index: AppIndex,
+) -> Iterator[type[models.Model]]:
+    """Yield models preceded by their abstract bases from checked apps.
+
+    Fields inherited from an abstract model aren't defined in the body of
+    its subclasses, they are checked once with the abstract model.
+    """
+    seen: set[type] = set()
+    for model in models_:
+        for base in reversed(model.__mro__[1:]):
+            if base in seen:
+                continue
+            seen.add(base)
+            if not (
+                issubclass(base, models.Model)
+                and base is not models.Model
+                and base._meta.abstract
+            ):
+                continue
+            app = base._meta.app_config
+            if (
+                app is not None
+                and (app_configs is None or app in app_configs)
+                and _is_app_checked(app, include_apps, app_index)
+            ):
+                yield base
+        yield model
+
+
 @registry.add_handler(django.core.checks.Tags.models)
 def check_models(
     checks: Iterable[Union["CheckModel", "CheckModelField", "CheckModelMeta"]],
     config: ChecksConfig,
     app_configs: Optional[list[Any]] = None,
+    models: Optional[Iterable[type[models.Model]]] = None,
     **kwargs: Any,
 ) -> Iterator[Any]:
+    """Check models of `app_configs` or only the given `models`."""
     model_checks: list[Union[CheckModel, CheckModelMeta]] = []
     field_checks = []
     meta_checks = []
@@ -56,23 +126,123 @@ def check_models(
             field_checks.append(check)
     if not model_checks and not field_checks:
         return
-    for model in _get_models_to_check(
-        app_configs=app_configs, include_apps=config.include_apps
-    ):
-        model_ast = get_model_ast(model, [c.Id for c in meta_checks])
+    changed_files = (
+        get_changed_files(config.changed_since) if config.changed_since else None
+    )
+    facts_store.clear()
+    source_store.facts_cache = (
+        SocketFactsCache(config.cache_socket)
+        if config.cache_socket
+        else SourceFactsCache(os.path.join(config.cache_dir, "facts"))
+        if config.cache_dir
+        else None
+    )
+    source_store.revalidate()
+    yield from runner.run(
+        _get_models_to_check(
+            app_configs=app_configs,
+            include_apps=config.include_apps,
+            changed_files=changed_files,
+            models_=models,
+            app_index=config.get_app_index(),
+        ),
+        partial(
+            _check_model,
+            model_checks=model_checks,
+            field_checks=FieldChecksTable(field_checks),
+            meta_check_ids=[c.Id for c in meta_checks],
+            ignore=config.ignore,
+        ),
+        cache=ResultCache.create(checks, config),
+        dependencies=_get_model_dependencies,
+        jobs=config.jobs,
+        release=True,
+    )
+
+
+class FieldChecksTable:
+    """Field checks applicable to a field class, resolved once per class."""
+
+    def __init__(self, checks: Iterable["CheckModelField"]) -> None:
+        self._checks = list(checks)
+        self._table: dict[type[models.Field], list[CheckModelField]] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._checks)
+
+    def __getitem__(self, field_class: type[models.Field]) -> list["CheckModelField"]:
+        try:
+            return self._table[field_class]
+        except KeyError:
+            checks = self._table[field_class] = [
+                c for c in self._checks if issubclass(field_class, c.field_types)
+            ]
+            return checks
+
+
+def _get_model_dependencies(model: type[models.Model]) -> set[type]:
+    return {type(f) for f in model._meta.local_fields}
+
+
+def _check_model(
+    model: type[models.Model],
+    *,
+    model_checks: Iterable[Union["CheckModel", "CheckModelMeta"]],
+    field_checks: FieldChecksTable,
+    meta_check_ids: list[CheckId],
+    ignore: IgnoreRules,
+) -> Iterator[Any]:
+    model_ast = get_model_ast(model, meta_check_ids)
+    ignored = ignore.resolve(model)
+    if not model._meta.abstract:
+        # model and Meta checks skip abstract models, their fields are checked
         for check in model_checks:
-            yield from check(model, ast=model_ast)
-        if field_checks:
-            for field, field_ast in model_ast.field_nodes:
-                for check in field_checks:
-                    yield from check(field, ast=field_ast, model=model)
+            if check.Id not in ignored:
+                yield from check(model, ast=model_ast)
+    if not field_checks:
+        return
+    if model._meta.abstract:
+        # options of abstract models apply to their concrete subclasses
+        yield from _check_fields(
+            model, model_ast.field_nodes, field_checks, ignore, uses_model_options=False
+        )
+        return
+    yield from _check_fields(model, model_ast.field_nodes, field_checks, ignore)
+    # inherited fields are checked with the abstract model that defines them,
+    # except by checks that depend on options of the concrete model
+    yield from _check_fields(
+        model,
+        model_ast.inherited_field_nodes,
+        field_checks,
+        ignore,
+        uses_model_options=True,
+    )
+
+
+def _check_fields(
+    model: type[models.Model],
+    fields: Iterable[tuple[models.Field, Any]],
+    field_checks: FieldChecksTable,
+    ignore: IgnoreRules,
+    *,
+    uses_model_options: Optional[bool] = None,
+) -> Iterator[Any]:
+    """Apply checks to fields, only those with the given `uses_model_options` if set."""
+    for field, field_ast in fields:
+        ignored = ignore.resolve(field)
+        for field_check in field_checks[type(field)]:
+            if field_check.Id not in ignored and uses_model_options in (
+                None,
+                field_check.uses_model_options,
+            ):
+                yield from field_check(field, ast=field_ast, model=model)
 
 
 class CheckModel(BaseCheck):
     @abstractmethod
     def apply(
         self, model: type[models.Model], ast: ModelASTProtocol
-    ) -> Iterator[django.core.checks.CheckMessage]:
+    ) -> Iterator[Message]:
         raise NotImplementedError()
 
 
@@ -80,7 +250,7 @@ class CheckModelMeta(BaseCheck):
     @abstractmethod
     def apply(
         self, model: type[models.Model], ast: ModelASTProtocol
-    ) -> Iterator[django.core.checks.CheckMessage]:
+    ) -> Iterator[Message]:
         raise NotImplementedError()
 
 
@@ -95,7 +265,7 @@ class CheckModelAttribute(CheckModel):
 
     def apply(
         self, model: type[models.Model], ast: ModelASTProtocol
-    ) -> Iterator[django.core.checks.CheckMessage]:
+    ) -> Iterator[Message]:
         for attr in self.attrs:
             if (
                 not model._meta.abstract
@@ -124,7 +294,7 @@ class CheckModelMetaAttribute(CheckModelMeta):
 
     def apply(
         self, model: type[models.Model], ast: ModelASTProtocol
-    ) -> Iterator[django.core.checks.CheckMessage]:
+    ) -> Iterator[Message]:
         for attr in self.attrs:
             if (
                 not model._meta.abstract
@@ -163,10 +333,13 @@ class CheckModelAdmin(CheckModel):
 
     def apply(
         self, model: type[models.Model], ast: ModelASTProtocol
-    ) -> Iterator[django.core.checks.CheckMessage]:
+    ) -> Iterator[Message]:
         if model not in self.models_with_admin:
             yield self.message("The model is not registered in admin.", obj=model)
 
+    def cache_key(self) -> Any:
+        return sorted(m._meta.label for m in self.models_with_admin)
+
 
 @registry.register(django.core.checks.Tags.models)
 class CheckNoUniqueTogether(CheckModelMeta):
@@ -174,7 +347,7 @@ class CheckNoUniqueTogether(CheckModelMeta):
 
     def apply(
         self, model: type[models.Model], ast: ModelASTProtocol
-    ) -> Iterator[django.core.checks.CheckMessage]:
+    ) -> Iterator[Message]:
         if ast.has_meta_var("unique_together"):
             yield self.message(
                 "Use UniqueConstraint with the constraints option instead.",
@@ -1,6 +1,6 @@
 from abc import abstractmethod
 from collections.abc import Iterator
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional, cast
 
 import django
 import django.core.checks
@@ -10,12 +10,19 @@ from django.db import models
 from .. import CheckId
 from ..ast import FieldASTProtocol, MissingASTError
 from ..ast.protocols import DisableCommentProtocol
+from ..facts import facts_store
 from ..forms import BaseCheckForm
 from ..registry import registry
-from .base_checks import BaseCheck, BaseCheckMixin
+from .base_checks import BaseCheck, BaseCheckMixin, Message
 
 
 class CheckModelField(BaseCheck):
+    # the check is applied only to fields of these types
+    field_types: ClassVar[tuple[type[models.Field], ...]] = (models.Field,)
+    # the check depends on Meta options of the model, e.g. indexes, so fields
+    # inherited from abstract models are checked with each concrete model
+    uses_model_options: ClassVar[bool] = False
+
     @abstractmethod
     def apply(
         self,
@@ -23,7 +30,7 @@ class CheckModelField(BaseCheck):
         *,
         ast: FieldASTProtocol,
         model: type[models.Model],
-    ) -> Iterator[django.core.checks.CheckMessage]:
+    ) -> Iterator[Message]:
         raise NotImplementedError()
 
     def __call__(
@@ -35,7 +42,7 @@ class CheckModelField(BaseCheck):
             pass
 
     def is_ignored(self, obj: Any) -> bool:
-        if self.skipif and self.skipif(obj):
+        if self.is_skipped(obj):
             return True
         return obj.model in self.ignore_objects or type(obj) in self.ignore_types
 
@@ -57,7 +64,7 @@ class CheckFieldVerboseName(CheckModelField):
 
     def apply(
         self, field: models.fields.Field, ast: FieldASTProtocol, **kwargs: Any
-    ) -> Iterator[django.core.checks.CheckMessage]:
+    ) -> Iterator[Message]:
         if not ast.get_arg("verbose_name"):
             yield self.message(
                 "Field has no verbose name.",
@@ -72,7 +79,7 @@ class CheckFieldVerboseNameGettext(GetTextMixin, CheckModelField):
 
     def apply(
         self, field: models.fields.Field, ast: FieldASTProtocol, **kwargs: Any
-    ) -> Iterator[django.core.checks.CheckMessage]:
+    ) -> Iterator[Message]:
         verbose_name = ast.get_arg("verbose_name")
         if verbose_name and not (
             verbose_name.is_callable
@@ -99,7 +106,7 @@ class CheckFieldVerboseNameGettextCase(GetTextMixin, CheckModelField):
 
     def apply(
         self, field: models.fields.Field, ast: FieldASTProtocol, **kwargs: Any
-    ) -> Iterator[django.core.checks.CheckMessage]:
+    ) -> Iterator[Message]:
         verbose_name = ast.get_arg("verbose_name")
         if verbose_name and (
             verbose_name.is_callable
@@ -120,7 +127,7 @@ class CheckFieldHelpTextGettext(GetTextMixin, CheckModelField):
 
     def apply(
         self, field: models.fields.Field, ast: FieldASTProtocol, **kwargs: Any
-    ) -> Iterator[django.core.checks.CheckMessage]:
+    ) -> Iterator[Message]:
         help_text = ast.get_arg("help_text")
         if help_text and not (
             help_text.is_callable and help_text.callable_func_name == self.gettext_func
@@ -135,34 +142,30 @@ class CheckFieldHelpTextGettext(GetTextMixin, CheckModelField):
 @registry.register(django.core.checks.Tags.models)
 class CheckFieldFileUploadTo(CheckModelField):
     Id = CheckId.X054
+    field_types = (models.FileField,)
 
-    def apply(
-        self, field: models.fields.Field, **kwargs: Any
-    ) -> Iterator[django.core.checks.CheckMessage]:
-        if isinstance(field, models.FileField):
-            if not field.upload_to:
-                yield self.message(
-                    f'Field "{field.name}" must have non empty "upload_to" attribute.',
-                    hint='Set "upload_to" on the field.',
-                    obj=field,
-                )
+    def apply(self, field: models.fields.Field, **kwargs: Any) -> Iterator[Message]:
+        if not cast(models.FileField, field).upload_to:
+            yield self.message(
+                f'Field "{field.name}" must have non empty "upload_to" attribute.',
+                hint='Set "upload_to" on the field.',
+                obj=field,
+            )
 
 
 @registry.register(django.core.checks.Tags.models)
 class CheckFieldTextNull(CheckModelField):
     Id = CheckId.X055
+    field_types = (models.CharField, models.TextField)
 
-    def apply(
-        self, field: models.fields.Field, **kwargs: Any
-    ) -> Iterator[django.core.checks.CheckMessage]:
-        if isinstance(field, (models.CharField, models.TextField)):
-            if field.null:
-                yield self.message(
-                    f'Field "{field.name}" shouldn\'t use `null=True` '
-                    "(django uses empty string for text fields).",
-                    hint="Remove `null=True` attribute from the field.",
-                    obj=field,
-                )
+    def apply(self, field: models.fields.Field, **kwargs: Any) -> Iterator[Message]:
+        if field.null:
+            yield self.message(
+                f'Field "{field.name}" shouldn\'t use `null=True` '
+                "(django uses empty string for text fields).",
+                hint="Remove `null=True` attribute from the field.",
+                obj=field,
+            )
 
 
 @registry.register(django.core.checks.Tags.models)
@@ -171,7 +174,7 @@ class CheckFieldNullFalse(CheckModelField):
 
     def apply(
         self, field: models.fields.Field, ast: FieldASTProtocol, **kwargs: Any
-    ) -> Iterator[django.core.checks.CheckMessage]:
+    ) -> Iterator[Message]:
         if field.null is False and ast.get_arg("null"):
             yield self.message(
                 "Argument `null=False` is default.",
@@ -183,6 +186,8 @@ class CheckFieldNullFalse(CheckModelField):
 @registry.register(django.core.checks.Tags.models)
 class CheckFieldForeignKeyIndex(CheckModelField):
     Id = CheckId.X058
+    field_types = (models.fields.related.RelatedField,)
+    uses_model_options = True
 
     class CheckFieldForeignKeyIndexForm(BaseCheckForm):
         when = forms.ChoiceField(
@@ -196,66 +201,47 @@ class CheckFieldForeignKeyIndex(CheckModelField):
         self.when = when or "indexes"
         super().__init__(**kwargs)
 
-    @classmethod
-    def get_index_values_in_meta(cls, model: type[models.Model]) -> Iterator[str]:
-        for entry in model._meta.unique_together:
-            yield from entry
-        if django.VERSION < (5, 1):
-            for entry in model._meta.index_together:
-                yield from entry
-        for constraint in model._meta.constraints:
-            if isinstance(constraint, models.UniqueConstraint):
-                yield from constraint.fields
-        for index in model._meta.indexes:
-            yield from index.fields
-
-    @classmethod
-    def get_fields_with_indexes_in_meta(
-        cls, model: type[models.Model]
-    ) -> Iterator[str]:
-        for entry in cls.get_index_values_in_meta(model):
-            yield entry.lstrip("-")
-
     def apply(
         self,
         field: models.fields.Field,
         ast: FieldASTProtocol,
         model: type[models.Model],
-    ) -> Iterator[django.core.checks.CheckMessage]:
-        if isinstance(field, models.fields.related.RelatedField):
-            if field.many_to_one and not ast.get_arg("db_index"):
-                if self.when == "indexes":
-                    if field.name in self.get_fields_with_indexes_in_meta(model):
-                        yield self.message(
-                            "ForeignKey field must set `db_index` explicitly if it present in other indexes.",
-                            hint="Specify `db_index` field argument.",
-                            obj=field,
-                        )
-                else:
+    ) -> Iterator[Message]:
+        if field.many_to_one and not ast.get_arg("db_index"):
+            if self.when == "indexes":
+                if facts_store.get_index_facts(model).is_indexed(field.name):
                     yield self.message(
-                        "ForeignKey must set `db_index` explicitly.",
+                        "ForeignKey field must set `db_index` explicitly if it present in other indexes.",
                         hint="Specify `db_index` field argument.",
                         obj=field,
                     )
+            else:
+                yield self.message(
+                    "ForeignKey must set `db_index` explicitly.",
+                    hint="Specify `db_index` field argument.",
+                    obj=field,
+                )
 
 
 @registry.register(django.core.checks.Tags.models)
 class CheckFieldRelatedName(CheckModelField):
     Id = CheckId.X061
+    field_types = (models.fields.related.RelatedField,)
 
     def apply(
         self,
         field: models.fields.Field,
         ast: FieldASTProtocol,
         model: type[models.Model],
-    ) -> Iterator[django.core.checks.CheckMessage]:
-        if isinstance(field, models.fields.related.RelatedField):
-            if not field.remote_field.related_name:
-                yield self.message(
-                    "Related fields must set `related_name` explicitly.",
-                    hint="Specify `related_name` field argument. Use `related_name='+'` to not create a backwards relation.",
-                    obj=field,
-                )
+    ) -> Iterator[Message]:
+        if not cast(
+            models.fields.related.RelatedField, field
+        ).remote_field.related_name:
+            yield self.message(
+                "Related fields must set `related_name` explicitly.",
+                hint="Specify `related_name` field argument. Use `related_name='+'` to not create a backwards relation.",
+                obj=field,
+            )
 
 
 @registry.register(django.core.checks.Tags.models)
@@ -264,7 +250,7 @@ class CheckFieldDefaultNull(CheckModelField):
 
     def apply(
         self, field: models.fields.Field, ast: FieldASTProtocol, **kwargs: Any
-    ) -> Iterator[django.core.checks.CheckMessage]:
+    ) -> Iterator[Message]:
         if field.null and field.default is None and ast.get_arg("default"):
             yield self.message(
                 "Argument `default=None` is redundant if `null=True` is set. (see docs about exceptions).",
@@ -276,6 +262,7 @@ class CheckFieldDefaultNull(CheckModelField):
 @registry.register(django.core.checks.Tags.models)
 class CheckFieldChoicesConstraint(CheckModelField):
     Id = CheckId.X060
+    uses_model_options = True
 
     @staticmethod
     def _repr_choice(value: Any) -> str:
@@ -288,29 +275,16 @@ class CheckFieldChoicesConstraint(CheckModelField):
         field: models.fields.Field,
         ast: FieldASTProtocol,
         model: type[models.Model],
-    ) -> Iterator[django.core.checks.CheckMessage]:
+    ) -> Iterator[Message]:
         choices = field.flatchoices
         if choices:
             field_choices = [c[0] for c in choices]
             if field.empty_strings_allowed and field.blank and "" not in field_choices:
                 field_choices.append("")
+            allowed = facts_store.get_choices_constraints(model).get(field.name, ())
+            if frozenset(field_choices) in allowed:
+                return
             in_name = f"{field.name}__in"
-            for constraint in model._meta.constraints:
-                if isinstance(constraint, models.CheckConstraint):
-                    condition = (
-                        constraint.check
-                        if django.VERSION < (5, 1)
-                        else constraint.condition
-                    )
-                    if not isinstance(condition, models.Q):
-                        continue
-                    for entry in condition.children:
-                        if (
-                            isinstance(entry, tuple)
-                            and entry[0] == in_name
-                            and set(field_choices) == set(entry[1])
-                        ):
-                            return
             check = f"models.Q({in_name}=[{', '.join([self._repr_choice(c) for c in field_choices])}])"
             arg_name = "condition" if django.VERSION >= (5, 1) else "check"
             yield self.message(
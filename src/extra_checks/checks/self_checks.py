@@ -4,11 +4,11 @@ from typing import Any, Optional
 import django.core.checks
 
 from .. import CheckId
-from ..registry import ChecksConfig, registry
-from .base_checks import BaseCheck
+from ..registry import SELF_CHECK_TAG, ChecksConfig, registry
+from .base_checks import BaseCheck, Message
 
 
-@registry.add_handler("extra_checks_selfcheck")
+@registry.add_handler(SELF_CHECK_TAG)
 def check_extra_checks_health(
     checks: Iterable["CheckConfig"],
     config: ChecksConfig,
@@ -34,14 +34,12 @@ def dict_to_text(data: dict, indent_level: int = 0) -> str:
     return "\n".join(output)
 
 
-@registry.register("extra_checks_selfcheck")
+@registry.register(SELF_CHECK_TAG)
 class CheckConfig(BaseCheck):
     Id = CheckId.X001
     level = django.core.checks.CRITICAL
 
-    def apply(
-        self, obj: ChecksConfig, **kwargs: Any
-    ) -> Iterator[django.core.checks.CheckMessage]:
+    def apply(self, obj: ChecksConfig, **kwargs: Any) -> Iterator[Message]:
         if obj.errors:
             yield self.message(
                 "Invalid EXTRA_CHECKS config.",
@@ -0,0 +1,187 @@
+"""Resident in-memory store of check results and source facts on a unix socket.
+
+Start it once next to `runserver` and set `cache_socket` to the same path,
+each autoreload then rechecks only classes whose sources changed and parses
+only files changed since they were stored:
+
+    python -m extra_checks.daemon .extra_checks.sock
+"""
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Any, Optional
+
+MAX_ENTRIES = 100_000
+# seconds to wait for a response of the daemon
+SOCKET_TIMEOUT = 2.0
+
+
+class ResultStore:
+    """Values by key, least recently used are dropped."""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        op = request.get("op")
+        if op == "get":
+            return {"values": [self.get(key) for key in request["keys"]]}
+        if op == "set":
+            for key, value in request["items"]:
+                self.set(key, value)
+            return {"ok": True}
+        return {"ok": False}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: "ResultServer"
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                store = self.server.stores[request.get("store", "results")]
+                response = store.handle(request)
+            except (ValueError, KeyError, TypeError, AttributeError):
+                response = {"ok": False}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class ResultServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        path: str,
+        store: Optional[ResultStore] = None,
+        facts: Optional[ResultStore] = None,
+    ) -> None:
+        self.store = store or ResultStore()
+        self.facts = facts or ResultStore()
+        self.stores = {"results": self.store, "facts": self.facts}
+        try:
+            mode = os.stat(path).st_mode
+        except FileNotFoundError:
+            pass
+        else:
+            if not stat.S_ISSOCK(mode):
+                raise FileExistsError(f"{path} exists and is not a socket.")
+            # socket left by a stopped daemon
+            os.unlink(path)
+        super().__init__(path, _RequestHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            os.unlink(self.server_address)  # type: ignore [arg-type]
+        except OSError:
+            pass
+
+
+class DaemonClient:
+    """Connection to the daemon, requests return None while it isn't available."""
+
+    def __init__(self, path: str, timeout: float = SOCKET_TIMEOUT) -> None:
+        self.path = path
+        self.timeout = timeout
+        self.available = True
+        self._connection: Optional[tuple[int, socket.socket, Any]] = None
+
+    def _connect(self) -> Optional[tuple[socket.socket, Any]]:
+        pid = os.getpid()
+        if self._connection is not None and self._connection[0] == pid:
+            return self._connection[1:]
+        # forked workers don't share the connection with the parent
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # a hung daemon must not block checks
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.path)
+        except OSError:
+            sock.close()
+            self.available = False
+            return None
+        self._connection = (pid, sock, sock.makefile("rb"))
+        return self._connection[1:]
+
+    def request(self, request: dict[str, Any]) -> Optional[dict[str, Any]]:
+        if not self.available:
+            return None
+        connection = self._connect()
+        if connection is None:
+            return None
+        sock, reader = connection
+        try:
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            return json.loads(reader.readline())
+        except (OSError, ValueError):
+            # including socket.timeout, the daemon isn't used after it
+            self.available = False
+            return None
+
+    def get_many(self, store: str, keys: Sequence[str]) -> Optional[list[Any]]:
+        """Return values of `keys` in one request, None if the daemon failed."""
+        response = self.request({"op": "get", "store": store, "keys": list(keys)})
+        values = response.get("values") if response else None
+        if not isinstance(values, list) or len(values) != len(keys):
+            return None
+        return values
+
+    def set_many(self, store: str, items: Sequence[tuple[str, Any]]) -> None:
+        if items:
+            self.request({"op": "set", "store": store, "items": list(items)})
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m extra_checks.daemon",
+        description="Keep results of extra checks in memory between django runs.",
+    )
+    parser.add_argument("path", help="Path of the unix socket, `cache_socket` option.")
+    parser.add_argument("--max-entries", type=int, default=MAX_ENTRIES)
+    args = parser.parse_args(argv)
+    try:
+        server = ResultServer(
+            args.path, ResultStore(args.max_entries), ResultStore(args.max_entries)
+        )
+    except OSError as e:
+        parser.error(str(e))
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Facts about models derived from their options, computed once per model."""
+
+import weakref
+from collections.abc import Iterable, Iterator
+from typing import Any, NamedTuple
+
+import django
+from django.db import models
+
+
+class IndexEntry(NamedTuple):
+    fields: tuple[str, ...]
+    descending: tuple[bool, ...]
+    unique: bool
+    source: str
+
+
+class IndexFacts:
+    """Indexes declared in model Meta with lookups by field names."""
+
+    def __init__(self, entries: Iterable[IndexEntry]) -> None:
+        self.entries = tuple(entries)
+        self.indexed_fields = frozenset(f for e in self.entries for f in e.fields)
+        self.prefixes = frozenset(
+            e.fields[:i] for e in self.entries for i in range(1, len(e.fields) + 1)
+        )
+        self.unique_sets = frozenset(
+            frozenset(e.fields) for e in self.entries if e.unique
+        )
+        self.descending_fields = frozenset(
+            f for e in self.entries for f, desc in zip(e.fields, e.descending) if desc
+        )
+
+    def is_indexed(self, field_name: str) -> bool:
+        """Return True if the field is a part of any index."""
+        return field_name in self.indexed_fields
+
+    def is_prefix(self, *field_names: str) -> bool:
+        """Return True if some index starts with the fields in the given order."""
+        return field_names in self.prefixes
+
+    def is_unique(self, *field_names: str) -> bool:
+        return frozenset(field_names) in self.unique_sets
+
+
+def _split_ordering(fields: Iterable[str]) -> tuple[tuple[str, ...], tuple[bool, ...]]:
+    names = tuple(f.lstrip("-") for f in fields)
+    return names, tuple(f.startswith("-") for f in fields)
+
+
+def _iter_index_entries(model: type[models.Model]) -> Iterator[IndexEntry]:
+    meta = model._meta
+    for entry in meta.unique_together:
+        yield IndexEntry(tuple(entry), (False,) * len(entry), True, "unique_together")
+    if django.VERSION < (5, 1):
+        for entry in meta.index_together:  # type: ignore [attr-defined]
+            yield IndexEntry(
+                tuple(entry), (False,) * len(entry), False, "index_together"
+            )
+    for constraint in meta.constraints:
+        if isinstance(constraint, models.UniqueConstraint) and constraint.fields:
+            yield IndexEntry(
+                tuple(constraint.fields),
+                (False,) * len(constraint.fields),
+                True,
+                "constraints",
+            )
+    for index in meta.indexes:
+        if index.fields:
+            yield IndexEntry(*_split_ordering(index.fields), False, "indexes")
+
+
+def _iter_in_lookups(q: models.Q) -> Iterator[tuple[str, Any]]:
+    """Yield `<field>__in` lookups that every row must satisfy."""
+    if q.negated or (q.connector != models.Q.AND and len(q.children) > 1):
+        return
+    for child in q.children:
+        if isinstance(child, models.Q):
+            yield from _iter_in_lookups(child)
+        elif isinstance(child, tuple) and child[0].endswith("__in"):
+            yield child[0][: -len("__in")], child[1]
+
+
+def _get_choices_constraints(
+    model: type[models.Model],
+) -> dict[str, frozenset[frozenset]]:
+    result: dict[str, set[frozenset]] = {}
+    for constraint in model._meta.constraints:
+        if not isinstance(constraint, models.CheckConstraint):
+            continue
+        condition = (
+            constraint.check if django.VERSION < (5, 1) else constraint.condition
+        )
+        if not isinstance(condition, models.Q):
+            continue
+        for name, values in _iter_in_lookups(condition):
+            try:
+                result.setdefault(name, set()).add(frozenset(values))
+            except TypeError:
+                # unhashable values
+                continue
+    return {name: frozenset(values) for name, values in result.items()}
+
+
+class FactsStore:
+    def __init__(self) -> None:
+        self._index_facts: weakref.WeakKeyDictionary[type[models.Model], IndexFacts] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._choices_constraints: weakref.WeakKeyDictionary[
+            type[models.Model], dict[str, frozenset[frozenset]]
+        ] = weakref.WeakKeyDictionary()
+
+    def get_index_facts(self, model: type[models.Model]) -> IndexFacts:
+        try:
+            return self._index_facts[model]
+        except KeyError:
+            facts = self._index_facts[model] = IndexFacts(_iter_index_entries(model))
+            return facts
+
+    def get_choices_constraints(
+        self, model: type[models.Model]
+    ) -> dict[str, frozenset[frozenset]]:
+        """Map field names to sets of values allowed by check constraints."""
+        try:
+            return self._choices_constraints[model]
+        except KeyError:
+            constraints = self._choices_constraints[model] = _get_choices_constraints(
+                model
+            )
+            return constraints
+
+    def clear(self) -> None:
+        self._index_facts.clear()
+        self._choices_constraints.clear()
+
+
+facts_store = FactsStore()
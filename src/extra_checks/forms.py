@@ -5,6 +5,7 @@ from django import forms
 from django.utils.translation import gettext_lazy as _
 
 from . import CheckId
+from .ignore import parse_rule
 
 
 class ListField(forms.Field):
@@ -115,9 +116,60 @@ class DictField(forms.ChoiceField):
             )
 
 
+class IgnoreField(forms.Field):
+    default_error_messages = {
+        "invalid_dict": _("Must be a dict of rules to lists of checks."),
+        "invalid_rule": _(
+            "%(value)s is not valid rule, use app.*, app.Model or app.Model.field."
+        ),
+        "invalid_choice": _("%(value)s is not one of the available checks."),
+    }
+
+    def to_python(self, value: typing.Any) -> dict[str, frozenset[CheckId]]:
+        if not value:
+            return {}
+        if not isinstance(value, dict):
+            raise forms.ValidationError(
+                self.error_messages["invalid_dict"], code="invalid_dict"
+            )
+        result = {}
+        for rule, ids in value.items():
+            if not isinstance(rule, str) or not parse_rule(rule):
+                raise forms.ValidationError(
+                    self.error_messages["invalid_rule"],
+                    code="invalid_rule",
+                    params={"value": rule},
+                )
+            if not isinstance(ids, (list, tuple, set, frozenset)):
+                raise forms.ValidationError(
+                    self.error_messages["invalid_dict"], code="invalid_dict"
+                )
+            check_ids = set()
+            for id_ in ids:
+                check_id = CheckId.find_check(id_) if isinstance(id_, str) else None
+                if check_id is None:
+                    raise forms.ValidationError(
+                        self.error_messages["invalid_choice"],
+                        code="invalid_choice",
+                        params={"value": id_},
+                    )
+                check_ids.add(check_id)
+            result[rule] = frozenset(check_ids)
+        return result
+
+
 class ConfigForm(forms.Form):
     errors: dict  # type: ignore [assignment]
     include_apps = ListField(forms.CharField(), required=False)
+    exclude_apps = ListField(forms.CharField(), required=False)
+    cache_dir = forms.CharField(required=False)
+    cache_socket = forms.CharField(required=False)
+    memoize = forms.BooleanField(required=False)
+    changed_since = forms.CharField(required=False)
+    jobs = forms.IntegerField(min_value=1, required=False)
+    profile = forms.BooleanField(required=False)
+    profile_output = forms.CharField(required=False)
+    ignore = IgnoreField(required=False)
     level = forms.ChoiceField(
         choices=[(c, c) for c in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]],
         required=False,
@@ -159,6 +211,19 @@ class ConfigForm(forms.Form):
             and "include_apps" not in self.data
         ):
             del self.cleaned_data["include_apps"]
+        for name in (
+            "exclude_apps",
+            "cache_dir",
+            "cache_socket",
+            "memoize",
+            "changed_since",
+            "jobs",
+            "profile",
+            "profile_output",
+            "ignore",
+        ):
+            if name in self.cleaned_data and not self.cleaned_data[name]:
+                del self.cleaned_data[name]
         if "level" in self.cleaned_data and "checks" in self.cleaned_data:
             for check in self.cleaned_data["checks"].values():
                 check.setdefault("level", self.cleaned_data["level"])
@@ -0,0 +1,74 @@
+from collections.abc import Mapping
+from typing import Any, Optional
+
+import django.apps
+
+from .check_id import CheckId
+
+NO_IDS: frozenset[CheckId] = frozenset()
+
+
+def parse_rule(pattern: str) -> Optional[tuple[str, ...]]:
+    """Split `app.*`, `app.Model` or `app.Model.field` pattern into parts."""
+    parts = tuple(pattern.split("."))
+    if not all(parts) or len(parts) not in (2, 3):
+        return None
+    if parts[1] == "*":
+        return parts[:1] if len(parts) == 2 else None
+    return (parts[0], parts[1].lower(), *parts[2:])
+
+
+class IgnoreRules:
+    """Checks ignored for apps, models and fields by `EXTRA_CHECKS["ignore"]`.
+
+    Rules for an app apply to all its models and serializers, rules for
+    a model apply to its fields too. Serializers are addressed by
+    `app.SerializerName` where app contains the serializer's module.
+    """
+
+    def __init__(
+        self, rules: Optional[Mapping[str, frozenset[CheckId]]] = None
+    ) -> None:
+        self.rules = dict(rules or {})
+        self._compiled: dict[tuple[str, ...], frozenset[CheckId]] = {}
+        for pattern, ids in self.rules.items():
+            key = parse_rule(pattern)
+            if key is None:
+                raise ValueError(f"Invalid ignore rule {pattern}.")
+            self._compiled[key] = self._compiled.get(key, NO_IDS) | ids
+        self._memo: dict[Any, frozenset[CheckId]] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._compiled)
+
+    def resolve(self, obj: Any) -> frozenset[CheckId]:
+        """Return ids of checks ignored for model, field or serializer class."""
+        if not self._compiled:
+            return NO_IDS
+        try:
+            return self._memo[obj]
+        except KeyError:
+            ids = self._memo[obj] = self._resolve(obj)
+            return ids
+
+    def _resolve(self, obj: Any) -> frozenset[CheckId]:
+        if not isinstance(obj, type):
+            model = getattr(obj, "model", None)
+            name = getattr(obj, "name", None)
+            if model is None or name is None:
+                return NO_IDS
+            meta = model._meta
+            return self.resolve(model) | self._compiled.get(
+                (meta.app_label, meta.model_name, name), NO_IDS
+            )
+        meta = getattr(obj, "_meta", None)
+        if meta is not None:
+            return self._compiled.get((meta.app_label,), NO_IDS) | self._compiled.get(
+                (meta.app_label, meta.model_name), NO_IDS
+            )
+        app_config = django.apps.apps.get_containing_app_config(obj.__module__)
+        if app_config is None:
+            return NO_IDS
+        return self._compiled.get((app_config.label,), NO_IDS) | self._compiled.get(
+            (app_config.label, obj.__name__.lower()), NO_IDS
+        )
@@ -0,0 +1,152 @@
+import json
+from typing import Any, Optional
+
+import django.core.checks
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from extra_checks import CheckId
+from extra_checks.ast.source_provider import SourceProvider
+from extra_checks.registry import registry
+
+LEVELS = {
+    "DEBUG": django.core.checks.DEBUG,
+    "INFO": django.core.checks.INFO,
+    "WARNING": django.core.checks.WARNING,
+    "ERROR": django.core.checks.ERROR,
+    "CRITICAL": django.core.checks.CRITICAL,
+}
+LEVEL_NAMES = {v: k for k, v in LEVELS.items()}
+
+
+def _get_label(obj: Any) -> Optional[str]:
+    if obj is None:
+        return None
+    if isinstance(obj, type):
+        meta = getattr(obj, "_meta", None)
+        return meta.label if meta else f"{obj.__module__}.{obj.__qualname__}"
+    return str(obj)
+
+
+def _get_location(obj: Any) -> tuple[Optional[str], Optional[int]]:
+    """Return file and line of the class or model field definition."""
+    name = None
+    if not isinstance(obj, type):
+        name = getattr(obj, "name", None)
+        obj = getattr(obj, "model", None)
+        if not isinstance(obj, type):
+            return None, None
+    provider = SourceProvider(obj)
+    if provider.module is None:
+        return None, None
+    node = provider.node
+    line = node.lineno if node else None
+    if node and name:
+        for child in node.body:
+            targets = getattr(child, "targets", None) or [
+                getattr(child, "target", None)
+            ]
+            if any(getattr(t, "id", None) == name for t in targets):
+                line = child.lineno
+                break
+    return provider.module.filename, line
+
+
+def _to_json(message: django.core.checks.CheckMessage) -> str:
+    filename, line = _get_location(message.obj)
+    return json.dumps(
+        {
+            "id": message.id,
+            "level": LEVEL_NAMES.get(message.level, message.level),
+            "msg": message.msg,
+            "hint": message.hint,
+            "obj": _get_label(message.obj),
+            "file": filename,
+            "line": line,
+        }
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Run extra checks without the rest of django checks framework "
+        "and print each message as a json line."
+    )
+    requires_system_checks: Any = []
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--tag",
+            action="append",
+            dest="tags",
+            help="Run only handlers of the tag, e.g. models.",
+        )
+        parser.add_argument(
+            "--check",
+            action="append",
+            dest="checks",
+            help="Run only the check, by id or name, e.g. X050 or field-verbose-name.",
+        )
+        parser.add_argument(
+            "--app",
+            action="append",
+            dest="apps",
+            help="Check only the app, by label.",
+        )
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            help="Check only the model, e.g. app_label.ModelName.",
+        )
+        parser.add_argument(
+            "--changed-since",
+            metavar="REF",
+            help="Check only code changed since the git ref, "
+            "overrides changed_since of EXTRA_CHECKS.",
+        )
+        parser.add_argument(
+            "--fail-level",
+            default="ERROR",
+            choices=list(LEVELS),
+            help="Message level that will cause the command to exit "
+            "with a non-zero status. Default is ERROR.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        ids = None
+        if options["checks"]:
+            ids = set()
+            for value in options["checks"]:
+                check_id = CheckId.find_check(value)
+                if check_id is None:
+                    raise CommandError(f"Unknown check {value}.")
+                ids.add(check_id)
+        try:
+            app_configs = (
+                [apps.get_app_config(label) for label in options["apps"]]
+                if options["apps"]
+                else None
+            )
+            models = (
+                [apps.get_model(label) for label in options["models"]]
+                if options["models"]
+                else None
+            )
+        except (LookupError, ValueError) as e:
+            raise CommandError(str(e))
+        kwargs = {} if models is None else {"models": models}
+        fail_level = LEVELS[options["fail_level"]]
+        failed = False
+        for message in registry.iter_messages(
+            options["tags"],
+            ids,
+            app_configs,
+            changed_since=options["changed_since"],
+            **kwargs,
+        ):
+            self.stdout.write(_to_json(message))
+            self.stdout.flush()
+            failed = failed or message.level >= fail_level
+        if failed:
+            raise CommandError("Extra checks found problems.", returncode=1)
@@ -0,0 +1,112 @@
+import atexit
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Stat:
+    __slots__ = ("calls", "messages", "time")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.messages = 0
+        self.time = 0.0
+
+
+class Profiler:
+    """Collect wall time, calls and messages of handlers, checks and source analysis.
+
+    Time of a section includes time of sections nested into it, e.g. a handler
+    includes its checks and a check includes `skipif` and comments lookup.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.output: Optional[str] = None
+        self.stats: dict[tuple[str, str], Stat] = {}
+        self._atexit_registered = False
+
+    def enable(self, output: Optional[str] = None) -> None:
+        self.enabled = True
+        self.output = output
+        if not self._atexit_registered:
+            atexit.register(self.write_report)
+            self._atexit_registered = True
+
+    def disable(self) -> None:
+        self.enabled = False
+        self.output = None
+        self.stats.clear()
+
+    def add(self, section: str, name: str, elapsed: float, messages: int = 0) -> None:
+        stat = self.stats.get((section, name))
+        if stat is None:
+            stat = self.stats[section, name] = Stat()
+        stat.calls += 1
+        stat.messages += messages
+        stat.time += elapsed
+
+    def call(
+        self, section: str, name: str, f: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        if not self.enabled:
+            return f(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return f(*args, **kwargs)
+        finally:
+            self.add(section, name, time.perf_counter() - start)
+
+    def iterate(self, section: str, name: str, iterable: Iterable[T]) -> Iterator[T]:
+        """Yield from iterable counting items and time spent producing them."""
+        elapsed = 0.0
+        messages = 0
+        iterator = iter(iterable)
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed += time.perf_counter() - start
+                messages += 1
+                yield item
+        finally:
+            self.add(section, name, elapsed, messages)
+
+    def wrap_handler(self, tag: str, handler: Callable) -> Callable:
+        def wrapper(*args: Any, **kwargs: Any) -> Iterator[Any]:
+            # messages are yielded as they are produced, e.g. by `extra_checks` command
+            return self.iterate("handler", tag, handler(*args, **kwargs))
+
+        return wrapper
+
+    def report(self) -> str:
+        rows = sorted(self.stats.items(), key=lambda item: -item[1].time)
+        width = max((len(name) for _, name in self.stats), default=4)
+        lines = [
+            "Extra checks profile:",
+            f"{'section':<10} {'name':<{width}} {'calls':>8} {'messages':>8} {'time, s':>10}",
+        ]
+        for (section, name), stat in rows:
+            lines.append(
+                f"{section:<10} {name:<{width}} {stat.calls:>8} {stat.messages:>8} {stat.time:>10.4f}"
+            )
+        return "\n".join(lines) + "\n"
+
+    def write_report(self) -> None:
+        if not self.enabled or not self.stats:
+            return
+        if self.output:
+            with open(self.output, "w") as f:
+                f.write(self.report())
+        else:
+            sys.stderr.write(self.report())
+
+
+profiler = Profiler()
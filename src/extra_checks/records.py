@@ -0,0 +1,56 @@
+from collections.abc import Iterable
+from typing import Any, NamedTuple, Optional
+
+import django.core.checks
+
+from .checks.base_checks import MESSAGE_MAP
+
+
+class MessageRecord(NamedTuple):
+    """Picklable and json serializable form of a check message.
+
+    The message object is stored relative to the checked class: `field` is
+    `None` when the message is about the class itself.
+    """
+
+    level: int
+    msg: str
+    hint: Optional[str]
+    id: Optional[str]
+    field: Optional[str] = None
+
+    @classmethod
+    def from_message(
+        cls, message: django.core.checks.CheckMessage, obj: type
+    ) -> Optional["MessageRecord"]:
+        if message.obj is obj:
+            field = None
+        elif getattr(message.obj, "model", None) is obj:
+            field = message.obj.name
+        else:
+            return None
+        return cls(message.level, message.msg, message.hint, message.id, field)
+
+    def to_message(self, obj: Any) -> django.core.checks.CheckMessage:
+        if self.field is not None:
+            obj = obj._meta.get_field(self.field)
+        if self.level in MESSAGE_MAP:
+            return MESSAGE_MAP[self.level](
+                self.msg, hint=self.hint, obj=obj, id=self.id
+            )
+        return django.core.checks.CheckMessage(
+            self.level, self.msg, hint=self.hint, obj=obj, id=self.id
+        )
+
+
+def to_records(
+    messages: Iterable[django.core.checks.CheckMessage], obj: type
+) -> Optional[list[MessageRecord]]:
+    """Return records for the messages or `None` if some can't be represented."""
+    records = []
+    for message in messages:
+        record = MessageRecord.from_message(message, obj)
+        if record is None:
+            return None
+        records.append(record)
+    return records
@@ -1,9 +1,13 @@
+import copy
+import importlib
+import importlib.metadata
 from collections.abc import Iterable, Iterator, Sequence
 from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    NamedTuple,
     Optional,
     Union,
 )
@@ -13,7 +17,10 @@ import django.core.checks
 from django.conf import settings
 
 from . import CheckId
+from .app_index import AppIndex
 from .forms import ConfigForm
+from .ignore import IgnoreRules
+from .profiling import profiler
 
 if TYPE_CHECKING:
     from .checks import BaseCheck
@@ -26,12 +33,41 @@ class ChecksConfig:
         errors: Optional[dict] = None,
         checks: Optional[dict[CheckId, dict]] = None,
         include_apps: Optional[Iterable[str]] = None,
+        exclude_apps: Optional[Iterable[str]] = None,
         ignored_objects: Optional[dict[CheckId, set[Any]]] = None,
+        cache_dir: Optional[str] = None,
+        cache_socket: Optional[str] = None,
+        memoize: bool = False,
+        changed_since: Optional[str] = None,
+        jobs: Optional[int] = None,
+        profile: bool = False,
+        profile_output: Optional[str] = None,
+        ignore: Optional[dict[str, frozenset[CheckId]]] = None,
     ) -> None:
         self.checks: dict[CheckId, dict] = {**(checks or {}), CheckId.X001: {}}
         self.include_apps = include_apps
+        self.exclude_apps = exclude_apps
+        self.cache_dir = cache_dir
+        self.cache_socket = cache_socket
+        self.memoize = memoize
+        self.changed_since = changed_since
+        self.jobs = jobs
+        self.profile = profile
+        self.profile_output = profile_output
+        self.ignore = IgnoreRules(ignore)
         self.errors = errors
         self.ignored_objects: dict[CheckId, set] = ignored_objects or {}
+        self._app_index: Optional[tuple[dict[str, Any], AppIndex]] = None
+
+    def get_app_index(self) -> AppIndex:
+        """Return index of installed apps shared by handlers of a checks run.
+
+        The index is built again when the set of installed apps is replaced.
+        """
+        app_configs = django.apps.apps.app_configs
+        if self._app_index is None or self._app_index[0] is not app_configs:
+            self._app_index = (app_configs, AppIndex(exclude_apps=self.exclude_apps))
+        return self._app_index[1]
 
     @classmethod
     def create(
@@ -71,13 +107,40 @@ class ChecksConfig:
 _ChecksHandler = Callable[[Optional[list[Any]], Any], Iterator[Any]]
 
 
+class CheckFamily(NamedTuple):
+    modules: Sequence[str]
+    tags: Sequence[str]
+    ids: frozenset[CheckId]
+    # top level packages that may be not installed
+    optional: frozenset[str] = frozenset()
+
+
+def _get_configured_checks() -> set[CheckId]:
+    result = {CheckId.X001}
+    config = getattr(settings, "EXTRA_CHECKS", None)
+    checks = config.get("checks") if isinstance(config, dict) else None
+    for check in checks if isinstance(checks, (list, tuple)) else []:
+        id_ = check.get("id") if isinstance(check, dict) else check
+        check_id = CheckId.find_check(id_) if isinstance(id_, str) else None
+        if check_id:
+            result.add(check_id)
+    return result
+
+
+SELF_CHECK_TAG = "extra_checks_selfcheck"
+
+
 class Registry:
-    def __init__(self) -> None:
+    def __init__(self, entry_points_group: Optional[str] = None) -> None:
         self.registered_checks: dict[type[BaseCheck], Sequence[str]] = {}
         self.enabled_checks: dict[str, list[BaseCheck]] = {}
         self.ignored_checks: dict[Any, set[Union[CheckId, str]]] = {}
         self.handlers: dict[str, _ChecksHandler] = {}
+        self.check_families: list[CheckFamily] = []
+        self.entry_points_group = entry_points_group
         self._config: Optional[ChecksConfig] = None
+        self._bound_handlers: Optional[dict[str, Callable]] = None
+        self._entry_points_loaded = False
 
     def _register(
         self, tags: Sequence[str], check_class: "type[BaseCheck]"
@@ -96,11 +159,11 @@ class Registry:
         checks: list["BaseCheck"],
         config: ChecksConfig,
     ) -> Optional[Callable]:
-        if checks:
-            f = partial(handler, checks, config)
-            django.core.checks.register(f, tag)  # pyright: ignore
-            return f
-        return None
+        if not checks:
+            return None
+        if config.profile:
+            handler = profiler.wrap_handler(tag, handler)
+        return partial(handler, checks, config)
 
     def register(self, *tags: str) -> Callable[["type[BaseCheck]"], "type[BaseCheck]"]:
         return partial(self._register, tags)
@@ -108,8 +171,53 @@ class Registry:
     def add_handler(self, tag: str) -> Callable[[Callable], Callable]:
         return partial(self._add_handler, tag)
 
-    def bind(self) -> dict[str, Callable]:
+    def add_check_family(
+        self,
+        modules: Sequence[str],
+        tags: Sequence[str],
+        ids: Iterable[CheckId],
+        optional: Iterable[str] = (),
+    ) -> None:
+        """Declare modules that register checks with `ids` and handlers for `tags`.
+
+        Modules are imported only when one of the ids is enabled, they are
+        skipped if one of `optional` packages isn't installed.
+        """
+        self.check_families.append(
+            CheckFamily(modules, tags, frozenset(ids), frozenset(optional))
+        )
+
+    def load_check_modules(self, ids: Iterable[CheckId]) -> None:
+        enabled = set(ids)
+        for family in self.check_families:
+            if family.ids & enabled:
+                for module in family.modules:
+                    try:
+                        importlib.import_module(module)
+                    except ModuleNotFoundError as e:
+                        name = (e.name or "").partition(".")[0]
+                        if name not in family.optional:
+                            raise
+
+    def load_entry_points(self) -> None:
+        if not self.entry_points_group or self._entry_points_loaded:
+            return
+        self._entry_points_loaded = True
+        entry_points = importlib.metadata.entry_points()
+        group: Iterable[importlib.metadata.EntryPoint]
+        if hasattr(entry_points, "select"):
+            group = entry_points.select(group=self.entry_points_group)
+        else:  # python < 3.10
+            group = entry_points.get(self.entry_points_group, [])
+        for entry_point in group:
+            entry_point.load()
+
+    def _bind(self) -> dict[str, Callable]:
+        self.load_entry_points()
+        self.load_check_modules(_get_configured_checks())
         config = ChecksConfig.create(self.registered_checks, self.ignored_checks)
+        if config.profile:
+            profiler.enable(config.profile_output)
         for check_class, tags in self.registered_checks.items():
             if check_class.Id in config.checks:
                 check = check_class(
@@ -128,9 +236,105 @@ class Registry:
         self._config = config
         return tag_handlers
 
+    def bind(self) -> dict[str, Callable]:
+        tag_handlers = self._bind()
+        for tag, f in tag_handlers.items():
+            django.core.checks.register(f, tag)  # pyright: ignore
+        return tag_handlers
+
+    def bind_lazy(self) -> dict[str, Callable]:
+        """Register handlers that validate config and create checks on first run.
+
+        Keeps config validation and checks creation out of the start of
+        processes that never run checks. Entry points are loaded here, django
+        runs only handlers registered before the checks run.
+        """
+        self.load_entry_points()
+        tag_handlers: dict[str, Callable] = {}
+        tags = [*self.handlers, *(t for f in self.check_families for t in f.tags)]
+        for tag in dict.fromkeys(tags):
+            f = partial(self._run_lazy, tag)
+            django.core.checks.register(f, tag)  # pyright: ignore
+            tag_handlers[tag] = f
+        return tag_handlers
+
+    def _run_lazy(
+        self, tag: str, app_configs: Optional[list[Any]] = None, **kwargs: Any
+    ) -> Iterable[Any]:
+        if self._bound_handlers is None:
+            self._bound_handlers = self._bind()
+        handler = self._bound_handlers.get(tag)
+        return handler(app_configs, **kwargs) if handler else []
+
+    def iter_messages(
+        self,
+        tags: Optional[Iterable[str]] = None,
+        ids: Optional[Iterable[CheckId]] = None,
+        app_configs: Optional[list[Any]] = None,
+        changed_since: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Iterator[django.core.checks.CheckMessage]:
+        """Yield messages of handlers and checks selected by `tags` and `ids`.
+
+        Runs handlers directly bypassing django checks framework,
+        config errors (X001) are always reported. `changed_since` overrides
+        the option of the config for this run.
+        """
+        if self._bound_handlers is None:
+            self._bound_handlers = self._bind()
+        assert self._config is not None
+        config = self._config
+        if changed_since is not None:
+            config = copy.copy(config)
+            config.changed_since = changed_since
+        tags = None if tags is None else {*tags, SELF_CHECK_TAG}
+        ids = None if ids is None else {*ids, CheckId.X001}
+        for tag, handler in self.handlers.items():
+            if tags is not None and tag not in tags:
+                continue
+            checks = [
+                c
+                for c in self.enabled_checks.get(tag, [])
+                if ids is None or c.Id in ids
+            ]
+            bound_handler = self._bind_handler(tag, handler, checks, config)
+            if bound_handler:
+                yield from bound_handler(app_configs, **kwargs)
+
     @property
     def is_healthy(self) -> bool:
         return True if self._config is None else not self._config.errors
 
 
-registry = Registry()
+registry = Registry(entry_points_group="extra_checks.checks")
+registry.add_check_family(
+    ["extra_checks.checks.self_checks"], [SELF_CHECK_TAG], [CheckId.X001]
+)
+registry.add_check_family(
+    ["extra_checks.checks.model_checks"],
+    [django.core.checks.Tags.models],
+    [CheckId.X010, CheckId.X011, CheckId.X012, CheckId.X013],
+)
+registry.add_check_family(
+    ["extra_checks.checks.model_checks", "extra_checks.checks.model_field_checks"],
+    [django.core.checks.Tags.models],
+    [
+        CheckId.X050,
+        CheckId.X051,
+        CheckId.X052,
+        CheckId.X053,
+        CheckId.X054,
+        CheckId.X055,
+        CheckId.X057,
+        CheckId.X058,
+        CheckId.X059,
+        CheckId.X060,
+        CheckId.X061,
+    ],
+)
+registry.add_check_family(
+    ["extra_checks.checks.drf_serializer_checks"],
+    ["extra_checks_drf_serializer"],
+    [CheckId.X301, CheckId.X302],
+    optional=["rest_framework"],
+)
@@ -0,0 +1,114 @@
+import math
+import multiprocessing
+from collections.abc import Iterable, Iterator, Sequence
+from functools import partial
+from typing import Any, Callable, Optional
+
+import django.core.checks
+
+from .ast.source_provider import release_sources
+from .cache import ResultCache
+from .records import MessageRecord, to_records
+
+_Produce = Callable[[Any], Iterable[django.core.checks.CheckMessage]]
+_Dependencies = Callable[[Any], Iterable[type]]
+
+# state inherited by forked workers, see `_run_parallel`
+_worker_state: Optional[
+    tuple[Sequence[type], Sequence[str], _Produce, Optional[ResultCache]]
+] = None
+
+CHUNKS_PER_JOB = 4
+
+
+def _no_dependencies(obj: type) -> Iterable[type]:
+    return ()
+
+
+def run(
+    objects: Iterable[type],
+    produce: _Produce,
+    *,
+    cache: Optional[ResultCache] = None,
+    dependencies: _Dependencies = _no_dependencies,
+    jobs: Optional[int] = None,
+    release: bool = False,
+) -> Iterator[django.core.checks.CheckMessage]:
+    """Yield messages produced for each object, in order of objects.
+
+    Cached results of all objects are requested at once before checks, with
+    `release` syntax tree of a module is released once its objects are checked.
+    """
+    objects = list(objects)
+    keys = []
+    if cache is not None:
+        keys = [cache.key(obj, dependencies(obj)) for obj in objects]
+        cache.prefetch(keys)
+    if jobs and jobs > 1 and "fork" in multiprocessing.get_all_start_methods():
+        yield from _run_parallel(objects, keys, produce, cache, jobs)
+        return
+    try:
+        for i, obj in enumerate(release_sources(objects) if release else objects):
+            if cache is None:
+                yield from produce(obj)
+            else:
+                yield from cache.run(keys[i], obj, partial(produce, obj))
+    finally:
+        if cache is not None:
+            cache.flush()
+
+
+def _check_chunk(chunk: range) -> list[tuple[Optional[list[MessageRecord]], bool]]:
+    """Return records of objects and whether they were taken from the cache.
+
+    Workers only read the cache, the parent stores results.
+    """
+    assert _worker_state is not None
+    objects, keys, produce, cache = _worker_state
+    result = []
+    for i in chunk:
+        obj = objects[i]
+        records = cache.get(keys[i]) if cache is not None else None
+        if records is None:
+            result.append((to_records(produce(obj), obj), False))
+        else:
+            result.append((records, True))
+    return result
+
+
+def _run_parallel(
+    objects: Sequence[type],
+    keys: Sequence[str],
+    produce: _Produce,
+    cache: Optional[ResultCache],
+    jobs: int,
+) -> Iterator[django.core.checks.CheckMessage]:
+    """Check contiguous partitions of objects in forked workers.
+
+    Workers inherit objects and checks from the parent process and send back
+    message records; the parent turns them into messages in original order.
+    """
+    global _worker_state
+    size = max(1, math.ceil(len(objects) / (jobs * CHUNKS_PER_JOB)))
+    chunks = [
+        range(i, min(i + size, len(objects))) for i in range(0, len(objects), size)
+    ]
+    _worker_state = (objects, keys, produce, cache)
+    try:
+        with multiprocessing.get_context("fork").Pool(jobs) as pool:
+            for chunk, results in zip(chunks, pool.imap(_check_chunk, chunks)):
+                for i, (records, cached) in zip(chunk, results):
+                    if records is None:
+                        # messages can't be sent from the worker, check in place
+                        yield from produce(objects[i])
+                        continue
+                    if cache is not None and cached:
+                        cache.remember(keys[i], records)
+                    elif cache is not None:
+                        cache.set(keys[i], records)
+                    for record in records:
+                        yield record.to_message(objects[i])
+    finally:
+        _worker_state = None
+        if cache is not None:
+            cache.flush()
@@ -0,0 +1,351 @@
+"""Checks that need only the source of models, run without django setup.
+
+Models and fields are recognized syntactically: a model is a class that
+inherits `Model` (e.g. `models.Model`), a model defined earlier in the same
+file or a class from `model_bases`; a field is an assignment of a call to
+a class named like `*Field` or `*ForeignKey` in the model body.
+
+Usage: `python -m extra_checks.static [options] path [path ...]`
+"""
+
+import argparse
+import ast
+import linecache
+import os
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from typing import NamedTuple, Optional
+
+from .ast.source_facts import get_first_lineno
+from .ast.source_provider import ModuleSource
+from .check_id import CheckId
+
+FIELD_CHECKS = frozenset(
+    {
+        CheckId.X050,
+        CheckId.X051,
+        CheckId.X052,
+        CheckId.X053,
+        CheckId.X057,
+        CheckId.X059,
+    }
+)
+META_CHECKS = frozenset({CheckId.X011, CheckId.X013})
+STATIC_CHECKS = FIELD_CHECKS | META_CHECKS
+RELATED_FIELD_SUFFIXES = (
+    "ForeignKey",
+    "ForeignObject",
+    "OneToOneField",
+    "ManyToManyField",
+    "GenericRelation",
+)
+FIELD_SUFFIXES = ("Field", *RELATED_FIELD_SUFFIXES)
+# GenericForeignKey is a models.Field since django 5.1 but not a related field
+NOT_RELATED_FIELDS = frozenset({"GenericForeignKey"})
+
+
+class StaticMessage(NamedTuple):
+    filename: str
+    line: int
+    col: int
+    id: CheckId
+    msg: str
+    obj: str
+
+    def __str__(self) -> str:
+        return f"{self.filename}:{self.line}:{self.col}: {self.id.name} {self.msg} [{self.id.value}]"
+
+
+def _get_name(node: ast.expr) -> Optional[str]:
+    """Return the last component of `name` or `module.name` expression."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _is_constant(node: Optional[ast.expr], value: object) -> bool:
+    return isinstance(node, ast.Constant) and node.value is value
+
+
+def _get_assignments(body: Iterable[ast.stmt]) -> dict[str, ast.Assign]:
+    result = {}
+    for node in body:
+        if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name):
+            result[node.targets[0].id] = node
+    return result
+
+
+def _is_invalid_case(value: object) -> bool:
+    return bool(
+        value
+        and isinstance(value, str)
+        and any(w != w.lower() and w != w.upper() for w in value.split(" "))
+    )
+
+
+class StaticChecker:
+    """Apply checks to models found in python source files."""
+
+    def __init__(
+        self,
+        checks: Iterable[CheckId] = STATIC_CHECKS - {CheckId.X011},
+        *,
+        meta_attrs: Sequence[str] = (),
+        gettext_func: str = "_",
+        model_bases: Iterable[str] = (),
+    ) -> None:
+        self.checks = frozenset(checks) & STATIC_CHECKS
+        self.meta_attrs = meta_attrs
+        self.gettext_func = gettext_func
+        self.model_bases = frozenset({"Model", *model_bases})
+
+    def check_file(self, filename: str) -> Iterator[StaticMessage]:
+        lines = linecache.getlines(filename)
+        if lines:
+            yield from self.check_module(ModuleSource(filename, lines))
+
+    def check_module(self, module: ModuleSource) -> Iterator[StaticMessage]:
+        models = set(self.model_bases)
+        for node in self._iter_classes(module.tree):
+            if any(
+                _get_name(base) in models or ast.unparse(base) in models
+                for base in node.bases
+            ):
+                models.add(node.name)
+                yield from self._check_model(module, node)
+
+    def _iter_classes(self, node: ast.AST) -> Iterator[ast.ClassDef]:
+        """Yield classes in the order of definition skipping nested scopes."""
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.ClassDef):
+                yield child
+            elif not isinstance(
+                child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)
+            ):
+                yield from self._iter_classes(child)
+
+    def _message(
+        self,
+        module: ModuleSource,
+        node: ast.stmt,
+        check_id: CheckId,
+        msg: str,
+        obj: str,
+        comment_node: Optional[ast.stmt],
+    ) -> Optional[StaticMessage]:
+        """Return message about the node unless disabled by comment above
+        `comment_node`, above decorators of classes."""
+        if comment_node is not None:
+            line = (
+                get_first_lineno(comment_node)
+                if isinstance(comment_node, ast.ClassDef)
+                else comment_node.lineno
+            )
+            if module.is_disabled_for_line(line, check_id):
+                return None
+        return StaticMessage(
+            module.filename, node.lineno, node.col_offset + 1, check_id, msg, obj
+        )
+
+    def _check_model(
+        self, module: ModuleSource, node: ast.ClassDef
+    ) -> Iterator[StaticMessage]:
+        meta = next(
+            (n for n in node.body if isinstance(n, ast.ClassDef) and n.name == "Meta"),
+            None,
+        )
+        meta_vars = _get_assignments(meta.body) if meta else {}
+        # meta checks skip abstract models but their fields are checked,
+        # like with django checks
+        abstract = _is_constant(getattr(meta_vars.get("abstract"), "value", None), True)
+        messages: list[Optional[StaticMessage]] = []
+        # meta checks are disabled by comment above Meta but reported at the class,
+        # like with django checks a model without Meta can't disable them
+        if (
+            CheckId.X011 in self.checks
+            and not abstract
+            and not _is_constant(getattr(meta_vars.get("proxy"), "value", None), True)
+        ):
+            for attr in self.meta_attrs:
+                if attr not in meta_vars:
+                    messages.append(
+                        self._message(
+                            module,
+                            node,
+                            CheckId.X011,
+                            f'Each model must specify "{attr}" attribute in its Meta.',
+                            node.name,
+                            meta,
+                        )
+                    )
+        if (
+            CheckId.X013 in self.checks
+            and not abstract
+            and "unique_together" in meta_vars
+        ):
+            messages.append(
+                self._message(
+                    module,
+                    node,
+                    CheckId.X013,
+                    "Use UniqueConstraint with the constraints option instead.",
+                    node.name,
+                    meta,
+                )
+            )
+        yield from (m for m in messages if m)
+        if self.checks & FIELD_CHECKS:
+            for name, assign in _get_assignments(node.body).items():
+                value = assign.value
+                if isinstance(value, ast.Call):
+                    field_class = _get_name(value.func)
+                    if field_class and field_class.endswith(FIELD_SUFFIXES):
+                        yield from self._check_field(
+                            module, assign, value, f"{node.name}.{name}"
+                        )
+
+    def _verbose_name(
+        self, call: ast.Call, kwargs: dict[str, ast.expr]
+    ) -> Optional[ast.expr]:
+        result = kwargs.get("verbose_name")
+        if result:
+            return result
+        field_class = _get_name(call.func)
+        if (
+            field_class
+            and field_class.endswith(RELATED_FIELD_SUFFIXES)
+            and field_class not in NOT_RELATED_FIELDS
+        ):
+            # the first argument of related fields is the related model
+            return None
+        if call.args:
+            arg = call.args[0]
+            if isinstance(arg, ast.Call) and hasattr(arg.func, "id"):
+                return arg
+            elif isinstance(arg, ast.Constant):
+                return arg
+        return None
+
+    def _is_gettext(self, node: Optional[ast.expr]) -> bool:
+        return (
+            isinstance(node, ast.Call)
+            and getattr(node.func, "id", None) == self.gettext_func
+        )
+
+    def _check_field(
+        self, module: ModuleSource, assign: ast.Assign, call: ast.Call, obj: str
+    ) -> Iterator[StaticMessage]:
+        kwargs = {kw.arg: kw.value for kw in call.keywords if kw.arg}
+        verbose_name = self._verbose_name(call, kwargs)
+        help_text = kwargs.get("help_text")
+        null = kwargs.get("null")
+        problems = []
+        if not verbose_name:
+            problems.append((CheckId.X050, "Field has no verbose name."))
+        if verbose_name and not self._is_gettext(verbose_name):
+            problems.append((CheckId.X051, "Verbose name should use gettext."))
+        if (
+            isinstance(verbose_name, ast.Call)
+            and self._is_gettext(verbose_name)
+            and verbose_name.args
+            and _is_invalid_case(getattr(verbose_name.args[0], "value", None))
+        ):
+            problems.append(
+                (
+                    CheckId.X052,
+                    "Words in verbose name must be all upper case or all lower case.",
+                )
+            )
+        if help_text and not self._is_gettext(help_text):
+            problems.append((CheckId.X053, "Help text should use gettext."))
+        if _is_constant(null, False):
+            problems.append((CheckId.X057, "Argument `null=False` is default."))
+        if _is_constant(null, True) and _is_constant(kwargs.get("default"), None):
+            problems.append(
+                (
+                    CheckId.X059,
+                    "Argument `default=None` is redundant if `null=True` is set. (see docs about exceptions).",
+                )
+            )
+        for check_id, msg in problems:
+            if check_id in self.checks:
+                message = self._message(module, assign, check_id, msg, obj, assign)
+                if message:
+                    yield message
+
+
+def _iter_files(paths: Iterable[str]) -> Iterator[str]:
+    """Yield python files, directories are searched for models modules."""
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+            in_models = os.path.basename(root) == "models"
+            for name in sorted(files):
+                if name.endswith(".py") and (in_models or name == "models.py"):
+                    yield os.path.join(root, name)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m extra_checks.static",
+        description="Run extra checks that need only source code of models.",
+    )
+    parser.add_argument("paths", nargs="+", help="Files or directories to check.")
+    parser.add_argument(
+        "--check",
+        action="append",
+        help="Id or code of the check to run, can be repeated. "
+        f"Defaults to all of {', '.join(sorted(c.value for c in STATIC_CHECKS))}.",
+    )
+    parser.add_argument(
+        "--meta-attr",
+        action="append",
+        default=[],
+        help="Attribute that each model must specify in its Meta (model-meta-attribute).",
+    )
+    parser.add_argument("--gettext-func", default="_")
+    parser.add_argument(
+        "--model-base",
+        action="append",
+        default=[],
+        help="Name of a base model class defined outside of the checked files.",
+    )
+    args = parser.parse_args(argv)
+    if args.check:
+        checks = set()
+        for value in args.check:
+            check = CheckId.find_check(value)
+            if check not in STATIC_CHECKS:
+                parser.error(f"{value} is not a check that runs without django.")
+            checks.add(check)
+    else:
+        checks = set(
+            STATIC_CHECKS if args.meta_attr else STATIC_CHECKS - {CheckId.X011}
+        )
+    checker = StaticChecker(
+        checks,
+        meta_attrs=args.meta_attr,
+        gettext_func=args.gettext_func,
+        model_bases=args.model_base,
+    )
+    found = False
+    for filename in _iter_files(args.paths):
+        try:
+            messages = list(checker.check_file(filename))
+        except SyntaxError as e:
+            sys.stderr.write(f"{filename}: {e}\n")
+            found = True
+            continue
+        for message in messages:
+            sys.stdout.write(f"{message}\n")
+            found = True
+    return int(found)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,6 @@
+import functools
 from collections.abc import Iterable, Iterator
+from importlib.metadata import PackageNotFoundError, version
 from typing import Optional, TypeVar
 
 TBase = TypeVar("TBase")
@@ -8,9 +10,27 @@ def collect_subclasses(
     bases: Iterable[type[TBase]],
     visited: Optional[set[type[TBase]]] = None,
 ) -> Iterator[type[TBase]]:
+    """Yield bases and all their descendants once, descendants first."""
     visited = visited or set()
-    for cls in bases:
-        if cls not in visited:
-            visited.add(cls)
-            yield from collect_subclasses(cls.__subclasses__(), visited)
+    stack: list[tuple[type[TBase], Iterator[type[TBase]]]] = []
+    subclasses = iter(bases)
+    while True:
+        for cls in subclasses:
+            if cls not in visited:
+                visited.add(cls)
+                stack.append((cls, subclasses))
+                subclasses = iter(cls.__subclasses__())
+                break
+        else:
+            if not stack:
+                return
+            cls, subclasses = stack.pop()
             yield cls
+
+
+@functools.cache
+def get_version() -> str:
+    try:
+        return version("django-extra-checks")
+    except PackageNotFoundError:
+        return "unknown"
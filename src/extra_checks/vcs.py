@@ -0,0 +1,61 @@
+import inspect
+import os
+import subprocess
+import warnings
+from collections.abc import Iterable, Iterator
+from typing import Optional
+
+from django.db import models
+
+
+def _git(cwd: Optional[str], *args: str) -> list[str]:
+    output = subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout
+    return [line for line in output.splitlines() if line]
+
+
+def get_changed_files(ref: str, cwd: Optional[str] = None) -> Optional[frozenset[str]]:
+    """Return real paths of files that differ from `ref`, including untracked ones.
+
+    Return `None` if the list can't be obtained from git.
+    """
+    try:
+        (root,) = _git(cwd, "rev-parse", "--show-toplevel")
+        names = _git(cwd, "diff", "--name-only", ref, "--")
+        names += _git(cwd, "ls-files", "--others", "--exclude-standard", "--full-name")
+    except (OSError, ValueError, subprocess.CalledProcessError) as e:
+        warnings.warn(
+            f"Can't get files changed since {ref!r}, checking everything: {e}",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        return None
+    return frozenset(os.path.realpath(os.path.join(root, name)) for name in names)
+
+
+def is_changed(cls: type, changed_files: frozenset[str]) -> bool:
+    """Return `True` if the class or any of its bases is defined in changed files."""
+    for klass in cls.__mro__:
+        try:
+            filename = inspect.getsourcefile(klass)
+        except TypeError:
+            continue
+        if filename and os.path.realpath(filename) in changed_files:
+            return True
+    return False
+
+
+def filter_changed_models(
+    models_: Iterable[type[models.Model]], changed_files: frozenset[str]
+) -> Iterator[type[models.Model]]:
+    """Yield changed models and models related to them."""
+    models_ = list(models_)
+    changed = {m for m in models_ if is_changed(m, changed_files)}
+    for model in models_:
+        if model in changed or any(
+            f.related_model in changed
+            for f in model._meta.get_fields()
+            if f.is_relation
+        ):
+            yield model
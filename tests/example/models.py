@@ -216,11 +216,44 @@ class ChoicesConstraint(models.Model):
         ]
 
 
+class NestedChoicesConstraint(models.Model):
+    nested = models.IntegerField(choices=[(1, "One"), (2, "Two")])
+    combined = models.CharField(choices=[("A", "a"), ("B", "b")])
+    negated = models.IntegerField(choices=[(1, "One"), (2, "Two")])
+    alternative = models.IntegerField(choices=[(1, "One"), (2, "Two")], null=True)
+
+    class Meta:
+        constraints = [
+            models.CheckConstraint(
+                name="nested_valid",
+                check=models.Q(models.Q(nested__in=[1, 2]), nested__gte=0),
+            ),
+            models.CheckConstraint(
+                name="combined_valid",
+                check=(
+                    models.Q(combined__in=["A", "B"])
+                    & (models.Q(nested__gt=0) & models.Q(nested__lt=3))
+                ),
+            ),
+            # constraints below don't enforce choices
+            models.CheckConstraint(
+                name="negated_valid", check=~models.Q(negated__in=[1, 2])
+            ),
+            models.CheckConstraint(
+                name="alternative_valid",
+                check=(
+                    models.Q(alternative__in=[1, 2])
+                    | models.Q(alternative__isnull=True)
+                ),
+            ),
+        ]
+
+
 # model checks can be disabled by comment right before the model class
-# if your model is decorated than comment must be placed between
-# decorator and class definition. eg:
-# >>> @mydecorator
+# if your model is decorated than comment must be placed before
+# the first decorator. eg:
 # >>> # extra-checks-disable-next-line model-attribute
+# >>> @mydecorator
 # >>> class MyModel:...
 #
 # extra-checks-disable-next-line model-attribute
@@ -234,6 +267,23 @@ class DisableCheckModel(models.Model):
         unique_together = ("text_fail", "no_site")
 
 
+def decorate(cls):
+    return cls
+
+
+# extra-checks-disable-next-line model-attribute
+@decorate
+class DisableCheckDecoratedModel(models.Model):
+    pass
+
+
+# Meta checks are disabled by comment above Meta,
+# the comment above a model without Meta doesn't disable them
+# extra-checks-disable-next-line model-meta-attribute
+class DisableMetaCheckWithoutMeta(models.Model):
+    pass
+
+
 class DisableManyChecksModel(models.Model):
     # disable two checks
     # extra-checks-disable-next-line field-text-null, field-verbose-name
@@ -247,3 +297,48 @@ class DisableManyChecksModel(models.Model):
     # extra-checks-disable-next-line no-unique-together
     class Meta:
         unique_together = ("text_fail", "text_fail2")
+
+
+class AbstractInheritedFields(models.Model):
+    # fields of abstract models are checked once for all subclasses
+    text_fail = models.TextField(null=True)
+    # extra-checks-disable-next-line field-verbose-name
+    title = models.CharField(max_length=32)
+
+    class Meta:
+        abstract = True
+        unique_together = ("text_fail", "title")
+
+
+class AbstractInheritedFieldsChild(AbstractInheritedFields):
+    name = models.CharField("name", max_length=32)
+
+    class Meta:
+        abstract = True
+
+
+class InheritedFieldsModel(AbstractInheritedFieldsChild):
+    pass
+
+
+class AnotherInheritedFieldsModel(AbstractInheritedFields):
+    title = models.CharField(max_length=64)
+
+
+class AbstractInheritedChoices(models.Model):
+    status = models.CharField(choices=[("a", "A"), ("b", "B")], max_length=1)
+    missed = models.CharField(choices=[("a", "A"), ("b", "B")], max_length=1)
+    author = models.ForeignKey(Author, related_name="+", on_delete=models.CASCADE)
+
+    class Meta:
+        abstract = True
+
+
+class InheritedChoicesConstraint(AbstractInheritedChoices):
+    class Meta:
+        constraints = [
+            models.CheckConstraint(
+                name="inherited_status_valid", check=models.Q(status__in=["a", "b"])
+            ),
+        ]
+        indexes = [models.Index(fields=["author", "status"])]
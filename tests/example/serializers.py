@@ -1,6 +1,6 @@
 from rest_framework import serializers
 
-from .models import Article, Author
+from .models import Article, Author, decorate
 
 
 class ArticleSerializer(serializers.ModelSerializer):
@@ -35,3 +35,11 @@ class DisableCheckSerializer(serializers.ModelSerializer):
     class Meta:
         model = Author
         extra_kwargs = {"first_name": {"read_only": True}}
+
+
+# extra-checks-disable-next-line drf-model-serializer-extra-kwargs
+@decorate
+class DisableCheckDecoratedSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Author
+        fields = ["first_name"]
@@ -0,0 +1,84 @@
+import os
+import site
+
+from django.apps import AppConfig, apps
+from django.core.checks import Tags
+
+from extra_checks.app_index import AppIndex
+from extra_checks.checks import drf_serializer_checks, model_checks, model_field_checks
+from extra_checks.registry import ChecksConfig
+from tests.example import models
+
+
+def test_get_app():
+    example = apps.get_app_config("example")
+    index = AppIndex()
+    assert index.get_app("tests.example.models") is example
+    assert index.get_app("tests.example") is example
+    assert index.get_app("tests.settings") is None
+
+    drf = AppConfig.create("rest_framework")
+    authtoken = AppConfig.create("rest_framework.authtoken")
+    index = AppIndex([authtoken, drf])
+    assert index.get_app("rest_framework.serializers") is drf
+    assert index.get_app("rest_framework.authtoken.serializers") is authtoken
+    assert index.get_app("rest_framework_other") is None
+
+
+def test_third_party():
+    index = AppIndex()
+    assert not index.is_third_party_module("tests.example.models")
+    assert index.is_third_party_path(os.path.join(site.PREFIXES[0], "lib", "a.py"))
+    assert not index.is_third_party_path(None)
+
+
+def test_exclude_apps():
+    example = apps.get_app_config("example")
+    index = AppIndex(exclude_apps=["exam*"])
+    assert index.is_excluded(example)
+    assert not index.is_excluded(apps.get_app_config("auth"))
+    assert AppIndex(exclude_apps=["*/tests/*"]).is_excluded(example)
+    assert list(model_checks._get_models_to_check(app_index=index)) == []
+    assert models.Article in model_checks._get_models_to_check(app_index=AppIndex())
+
+
+def test_app_index_per_installed_apps(settings):
+    config = ChecksConfig()
+    module = "django.contrib.humanize.templatetags"
+    index = config.get_app_index()
+    assert index.get_app(module) is None
+    assert config.get_app_index() is index
+    settings.INSTALLED_APPS = [*settings.INSTALLED_APPS, "django.contrib.humanize"]
+    assert config.get_app_index().get_app(module) is not None
+
+
+def test_app_index_shared_by_handlers(registry, settings, monkeypatch):
+    settings.EXTRA_CHECKS = {
+        "checks": ["field-verbose-name", "drf-model-serializer-extra-kwargs"]
+    }
+    registry._register([Tags.models], model_field_checks.CheckFieldVerboseName)
+    registry._register(
+        ["extra_checks_drf_serializer"],
+        drf_serializer_checks.CheckDRFSerializerExtraKwargs,
+    )
+    registry._add_handler(Tags.models, model_checks.check_models)
+    registry._add_handler(
+        "extra_checks_drf_serializer", drf_serializer_checks.check_drf_serializers
+    )
+    indexes = []
+
+    def get_models(*args, app_index, **kwargs):
+        indexes.append(app_index)
+        return iter(())
+
+    def get_serializers(include_apps, changed_files, app_configs, app_index, models):
+        indexes.append(app_index)
+        return iter(()), iter(())
+
+    monkeypatch.setattr(model_checks, "_get_models_to_check", get_models)
+    monkeypatch.setattr(
+        drf_serializer_checks, "_get_serializers_to_check", get_serializers
+    )
+    assert list(registry.iter_messages()) == []
+    assert len(indexes) == 2
+    assert indexes[0] is indexes[1]
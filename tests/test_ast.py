@@ -0,0 +1,24 @@
+from extra_checks.ast import get_model_ast
+from extra_checks.ast.ast import ArgAST
+from tests.example import models
+
+
+def test_field_nodes():
+    model_ast = get_model_ast(models.ModelFieldVerboseName, [])
+    fields = {field.name: field_ast for field, field_ast in model_ast.field_nodes}
+    # fields not defined in the class body are skipped
+    assert "id" not in fields
+    assert fields["first_arg_name"].get_arg("verbose_name") == ArgAST(
+        False, None, "first arg name [test]"
+    )
+    arg = fields["gettext_case"].get_arg("verbose_name")
+    assert arg is not None
+    assert arg.is_callable
+    assert arg.callable_func_name == "_"
+    assert arg.get_call_first_args() == "Kwarg Name [test]"
+    # the first argument of related fields is the related model
+    assert fields["no_name_related"].get_arg("verbose_name") is None
+    assert fields["no_name_nested_field"].get_arg("verbose_name") is None
+    assert fields["no_name"].get_arg("max_length") == ArgAST(False, None, 32)
+    # the table is built once
+    assert [f.name for f, _ in model_ast.field_nodes] == list(fields)
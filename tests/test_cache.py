@@ -0,0 +1,254 @@
+import importlib
+import os
+import socket
+import sys
+import threading
+
+import pytest
+
+from extra_checks.ast.source_provider import ModuleSource, source_store
+from extra_checks.cache import MemoResultCache, SocketResultCache, _normalize
+from extra_checks.checks import model_checks, model_field_checks
+from extra_checks.daemon import ResultServer, ResultStore
+from tests.example import models
+
+
+@pytest.fixture
+def test_case(test_case, tmp_path):
+    return (
+        test_case.handler(model_checks.check_models)
+        .models(models.ModelFieldTextNull)
+        .check(model_field_checks.CheckFieldTextNull)
+        .settings(
+            {
+                "cache_dir": str(tmp_path),
+                "checks": [model_field_checks.CheckFieldTextNull.Id.value],
+            }
+        )
+    )
+
+
+def test_cached_messages(test_case, monkeypatch, tmp_path):
+    messages = test_case.run()
+    assert any(tmp_path.iterdir())
+
+    def apply(*args, **kwargs):
+        raise AssertionError("cached results must be used")
+
+    monkeypatch.setattr(model_field_checks.CheckFieldTextNull, "apply", apply)
+    cached = test_case.run()
+    assert [(m.id, m.level, m.msg, m.hint, m.obj) for m in cached] == [
+        (m.id, m.level, m.msg, m.hint, m.obj) for m in messages
+    ]
+    assert {m.obj.name for m in cached} == {"text_fail", "chars_fail", "custom_fail"}
+
+
+def test_normalize_function_source(tmp_path, monkeypatch):
+    path = tmp_path / "skipif_module.py"
+    path.write_text("skipif = lambda field, **kwargs: False\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "skipif_module", raising=False)
+    module = importlib.import_module("skipif_module")
+    normalized = _normalize(module.skipif)
+    assert normalized == _normalize(module.skipif)
+    path.write_text("skipif = lambda field, **kwargs: True\n")
+    os.utime(path, ns=(0, 0))
+    source_store.revalidate()
+    assert _normalize(module.skipif) != normalized
+
+
+def test_cache_config_change(test_case, tmp_path):
+    messages = test_case.run()
+    assert {m.level for m in messages} == {model_field_checks.CheckFieldTextNull.level}
+    messages = test_case.settings(
+        {
+            "cache_dir": str(tmp_path),
+            "checks": [
+                {
+                    "id": model_field_checks.CheckFieldTextNull.Id.value,
+                    "level": "ERROR",
+                }
+            ],
+        }
+    ).run()
+    assert len(messages) == 3
+    assert all(m.is_serious() for m in messages)
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    server = ResultServer(str(tmp_path / "checks.sock"))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_cache_socket(test_case, monkeypatch, daemon):
+    test_case.settings(
+        {
+            "cache_socket": daemon.server_address,
+            "checks": [model_field_checks.CheckFieldTextNull.Id.value],
+        }
+    )
+    messages = test_case.run()
+    assert len(daemon.store) == 1
+
+    def apply(*args, **kwargs):
+        raise AssertionError("cached results must be used")
+
+    with monkeypatch.context() as m:
+        m.setattr(model_field_checks.CheckFieldTextNull, "apply", apply)
+        cached = test_case.run()
+    assert [(m.id, m.msg, m.obj) for m in cached] == [
+        (m.id, m.msg, m.obj) for m in messages
+    ]
+
+
+def test_cache_socket_batches_requests(test_case, monkeypatch, daemon):
+    test_case.settings(
+        {
+            "cache_socket": daemon.server_address,
+            "checks": [model_field_checks.CheckFieldTextNull.Id.value],
+        }
+    ).models(models.ModelFieldTextNull, models.ModelFieldFileUploadTo)
+    requests = []
+    handle = daemon.store.handle
+
+    def record(request):
+        requests.append(request["op"])
+        return handle(request)
+
+    monkeypatch.setattr(daemon.store, "handle", record)
+    test_case.run()
+    assert requests == ["get", "set"]
+    assert len(daemon.store) == 2
+    requests.clear()
+    test_case.run()
+    assert requests == ["get"]
+
+
+def test_cache_socket_facts(test_case, monkeypatch, daemon):
+    for name in ("_modules", "_stats", "_filenames"):
+        monkeypatch.setattr(source_store, name, {})
+    messages = test_case.settings(
+        {
+            "cache_socket": daemon.server_address,
+            "checks": [model_field_checks.CheckFieldTextNull.Id.value],
+        }
+    ).run()
+    assert len(daemon.facts)
+    for name in ("_modules", "_stats", "_filenames"):
+        monkeypatch.setattr(source_store, name, {})
+
+    def tree(self):
+        raise AssertionError("facts of the daemon must be used")
+
+    monkeypatch.setattr(ModuleSource, "tree", property(tree))
+    changed = test_case.settings(
+        {
+            "cache_socket": daemon.server_address,
+            "checks": [
+                {"id": model_field_checks.CheckFieldTextNull.Id.value, "level": "ERROR"}
+            ],
+        }
+    ).run()
+    assert [(m.msg, m.obj) for m in changed] == [(m.msg, m.obj) for m in messages]
+
+
+def test_cache_socket_unavailable(test_case, tmp_path):
+    messages = test_case.settings(
+        {
+            "cache_socket": str(tmp_path / "missing.sock"),
+            "checks": [model_field_checks.CheckFieldTextNull.Id.value],
+        }
+    ).run()
+    assert {m.obj.name for m in messages} == {"text_fail", "chars_fail", "custom_fail"}
+
+
+def test_cache_socket_timeout(tmp_path):
+    path = str(tmp_path / "hung.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        # accepts connections but never responds
+        server.bind(path)
+        server.listen()
+        cache = SocketResultCache(path, "fingerprint", timeout=0.1)
+        assert cache.get("key") is None
+        assert not cache.client.available
+
+
+def test_result_server_keeps_files(tmp_path):
+    path = tmp_path / "settings.py"
+    path.write_text("DEBUG = True\n")
+    with pytest.raises(FileExistsError):
+        ResultServer(str(path))
+    assert path.read_text() == "DEBUG = True\n"
+
+
+def test_result_store_size():
+    store = ResultStore(max_entries=2)
+    store.set("a", [])
+    store.set("b", [])
+    assert store.get("a") == []
+    store.set("c", [])
+    assert store.get("b") is None
+    assert len(store) == 2
+
+
+def test_memoize(test_case, monkeypatch):
+    test_case.settings(
+        {
+            "memoize": True,
+            "checks": [model_field_checks.CheckFieldTextNull.Id.value],
+        }
+    )
+    MemoResultCache.clear()
+    messages = test_case.run()
+
+    def apply(*args, **kwargs):
+        raise AssertionError("memoized results must be used")
+
+    with monkeypatch.context() as m:
+        m.setattr(model_field_checks.CheckFieldTextNull, "apply", apply)
+        memoized = test_case.run()
+    assert [(m.id, m.msg, m.obj) for m in memoized] == [
+        (m.id, m.msg, m.obj) for m in messages
+    ]
+    MemoResultCache.clear()
+    assert test_case.run()
+
+
+def test_memoize_parallel(test_case, monkeypatch):
+    test_case.settings(
+        {
+            "memoize": True,
+            "jobs": 2,
+            "checks": [model_field_checks.CheckFieldTextNull.Id.value],
+        }
+    ).models(models.ModelFieldTextNull, models.ModelFieldFileUploadTo)
+    MemoResultCache.clear()
+    messages = test_case.run()
+    # results of workers are memoized in the parent
+    assert len(MemoResultCache._memo) == 2
+
+    def apply(*args, **kwargs):
+        raise AssertionError("memoized results must be used")
+
+    with monkeypatch.context() as m:
+        m.setattr(model_field_checks.CheckFieldTextNull, "apply", apply)
+        memoized = test_case.run()
+    assert [(m.id, m.msg, m.obj) for m in memoized] == [
+        (m.id, m.msg, m.obj) for m in messages
+    ]
+
+
+def test_memoize_cleared_with_apps(settings):
+    MemoResultCache.clear()
+    MemoResultCache("fingerprint").set("key", [])
+    assert len(MemoResultCache._memo) == 1
+    MemoResultCache("fingerprint")
+    assert len(MemoResultCache._memo) == 1
+    settings.INSTALLED_APPS = [*settings.INSTALLED_APPS, "django.contrib.humanize"]
+    MemoResultCache("fingerprint")
+    assert not len(MemoResultCache._memo)
@@ -0,0 +1,87 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+import tests.example.serializers  # noqa: F401
+from extra_checks.registry import registry
+
+
+def _call(*args):
+    out = StringIO()
+    call_command("extra_checks", *args, "--fail-level", "CRITICAL", stdout=out)
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_model_check():
+    messages = _call("--model", "example.ModelFieldTextNull", "--check", "X055")
+    assert [m["obj"] for m in messages] == [
+        "example.ModelFieldTextNull.text_fail",
+        "example.ModelFieldTextNull.chars_fail",
+        "example.ModelFieldTextNull.custom_fail",
+    ]
+    assert {m["id"] for m in messages} == {"X055"}
+    assert messages[0]["level"] == "ERROR"
+    assert messages[0]["file"].endswith("example/models.py")
+    assert messages[1]["line"] == messages[0]["line"] + 1
+
+
+def test_model_all_checks():
+    messages = _call("--model", "example.ModelFieldTextNull")
+    assert messages
+    # serializers of other models aren't checked
+    assert all(m["obj"].startswith("example.ModelFieldTextNull") for m in messages)
+    objs = {m["obj"] for m in _call("--model", "example.Author")}
+    assert "tests.example.serializers.AuthorSerializer" in objs
+    assert "tests.example.serializers.ArticleSerializer" not in objs
+
+
+def test_changed_since(monkeypatch):
+    refs = []
+
+    def get_changed_files(ref):
+        refs.append(ref)
+        return frozenset()
+
+    for module in ("model_checks", "drf_serializer_checks"):
+        monkeypatch.setattr(
+            f"extra_checks.checks.{module}.get_changed_files", get_changed_files
+        )
+    assert _call("--changed-since", "origin/main") == []
+    assert set(refs) == {"origin/main"}
+    # the option of the config isn't changed
+    assert registry._config is not None
+    assert registry._config.changed_since is None
+
+
+def test_tag_and_app():
+    messages = _call("--tag", "extra_checks_drf_serializer", "--app", "example")
+    assert messages
+    assert {m["id"] for m in messages} <= {"X301", "X302"}
+    assert {m["obj"] for m in messages} >= {
+        "tests.example.serializers.AuthorSerializer"
+    }
+    assert not _call("--tag", "extra_checks_drf_serializer", "--app", "auth")
+
+
+def test_check_by_name():
+    messages = _call("--check", "field-file-upload-to")
+    assert messages
+    assert {m["id"] for m in messages} == {"X054"}
+
+
+def test_fail_level():
+    with pytest.raises(CommandError) as e:
+        call_command(
+            "extra_checks", "--model", "example.ModelFieldTextNull", stdout=StringIO()
+        )
+    assert e.value.returncode == 1
+
+
+@pytest.mark.parametrize(
+    "args", [["--check", "X999"], ["--app", "unknown"], ["--model", "example"]]
+)
+def test_invalid_arguments(args):
+    with pytest.raises(CommandError):
+        _call(*args)
@@ -138,3 +138,23 @@ def test_config_build_ignored():
         CheckId.X011: {Author},
         CheckId.X050: {Author},
     }
+
+
+def test_config_ignore():
+    form = ConfigForm(
+        data={"checks": [], "ignore": {"app.Model.field": ["X050", "field-null"]}}
+    )
+    assert form.is_valid({})
+    assert form.cleaned_data["ignore"] == {
+        "app.Model.field": {CheckId.X050, CheckId.X057}
+    }
+    form = ConfigForm(data={"ignore": {"app": ["X050"]}})
+    assert not form.is_valid({})
+    assert form.errors == {
+        "ignore": ["app is not valid rule, use app.*, app.Model or app.Model.field."]
+    }
+    form = ConfigForm(data={"ignore": {"app.*": ["X000"]}})
+    assert not form.is_valid({})
+    assert form.errors == {"ignore": ["X000 is not one of the available checks."]}
+    form = ConfigForm(data={"ignore": ["app.*"]})
+    assert not form.is_valid({})
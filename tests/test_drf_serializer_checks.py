@@ -5,15 +5,19 @@ try:
     import rest_framework.serializers
 except ImportError:
     pytest.skip("skipping rest_framework tests", allow_module_level=True)
+from extra_checks.app_index import AppIndex
 from extra_checks.checks.drf_serializer_checks import (
     CheckDRFSerializerExtraKwargs,
     CheckDRFSerializerMetaAttribute,
+    DisableCommentProvider,
+    _discover_serializers,
     _get_serializers_to_check,
     check_drf_serializers,
 )
 from tests.example.serializers import (
     ArticleSerializer,
     AuthorSerializer,
+    DisableCheckDecoratedSerializer,
     DisableCheckSerializer,
     InheritedArticleSerializer,
     InheritedAuthorSerializer,
@@ -69,6 +73,22 @@ def test_get_serializers_to_check():
     assert all(m.__module__ == module for m in ms)
 
 
+def test_discover_serializers_grouped_by_module():
+    serializers, model_serializers = _discover_serializers(
+        app_index=AppIndex(exclude_apps=["rest_framework*"])
+    )
+    assert not serializers
+    assert set(model_serializers) == {"tests.example.serializers"}
+    assert set(model_serializers["tests.example.serializers"]) == {
+        ArticleSerializer,
+        AuthorSerializer,
+        DisableCheckDecoratedSerializer,
+        DisableCheckSerializer,
+        InheritedArticleSerializer,
+        InheritedAuthorSerializer,
+    }
+
+
 def test_get_serializers_to_check_include_apps(settings):
     settings.INSTALLED_APPS += ["rest_framework.authtoken", "rest_framework"]
     ss, ms = (list(s) for s in _get_serializers_to_check(["rest_framework.authtoken"]))
@@ -79,12 +99,19 @@ def test_get_serializers_to_check_include_apps(settings):
     ss, ms = (list(s) for s in _get_serializers_to_check(["rest_framework"]))
     assert len(ms) == 1
     assert ms[0] is rest_framework.serializers.HyperlinkedModelSerializer
-    # FIXME: the lines below actually a bug
-    # include_apps must filter out rest_framework.authtoken app
-    # but it's nested into rest_framework app that present in the
-    # include_apps so it's included too
-    assert len(ss) == 1
-    assert ss[0] is rest_framework.authtoken.serializers.AuthTokenSerializer
+    # rest_framework.authtoken app is nested into rest_framework
+    # but it's not in the include_apps
+    assert not ss
+
+    ss, ms = (
+        list(s)
+        for s in _get_serializers_to_check(
+            ["rest_framework.authtoken", "rest_framework"],
+            app_index=AppIndex(exclude_apps=["authtoken"]),
+        )
+    )
+    assert ms == [rest_framework.serializers.HyperlinkedModelSerializer]
+    assert not ss
 
 
 def test_drf_ignore_meta_checks(test_case):
@@ -95,3 +122,10 @@ def test_drf_ignore_meta_checks(test_case):
         .run()
     )
     assert not messages
+
+
+def test_disable_comment_above_decorator():
+    provider = DisableCommentProvider(DisableCheckDecoratedSerializer)
+    assert provider.is_disabled_by_comment(CheckDRFSerializerExtraKwargs.Id.value)
+    provider = DisableCommentProvider(DisableCheckSerializer)
+    assert not provider.is_disabled_by_comment(CheckDRFSerializerExtraKwargs.Id.value)
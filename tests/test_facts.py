@@ -0,0 +1,42 @@
+from extra_checks.facts import FactsStore, facts_store
+from tests.example import models
+
+
+def test_index_facts():
+    facts = facts_store.get_index_facts(models.ModelFieldForeignKeyIndex)
+    assert facts is facts_store.get_index_facts(models.ModelFieldForeignKeyIndex)
+    assert facts.is_indexed("field_in_indexes")
+    assert facts.is_indexed("field_index_desc")
+    assert facts.is_indexed("field_three")
+    assert not facts.is_indexed("another_article")
+    assert facts.is_prefix("author")
+    assert facts.is_prefix("field_in_indexes", "field_index_desc")
+    assert not facts.is_prefix("field_index_desc")
+    assert facts.is_unique("article", "author")
+    assert facts.is_unique("field_three", "author")
+    assert not facts.is_unique("field_in_indexes")
+    assert facts.descending_fields == {"field_index_desc"}
+    assert {e.source for e in facts.entries} >= {
+        "unique_together",
+        "constraints",
+        "indexes",
+    }
+
+
+def test_facts_store_clear():
+    store = FactsStore()
+    facts = store.get_index_facts(models.Author)
+    assert not facts.entries
+    store.clear()
+    assert store.get_index_facts(models.Author) is not facts
+
+
+def test_choices_constraints():
+    constraints = facts_store.get_choices_constraints(models.NestedChoicesConstraint)
+    assert constraints == {
+        "nested": {frozenset([1, 2])},
+        "combined": {frozenset(["A", "B"])},
+    }
+    constraints = facts_store.get_choices_constraints(models.ChoicesConstraint)
+    assert constraints["blank"] == {frozenset(["A", "B", ""])}
+    assert "url" not in constraints
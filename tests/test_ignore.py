@@ -1,8 +1,12 @@
 import django.db.models
 import pytest
 
+from extra_checks import CheckId
 from extra_checks.checks import model_checks, model_field_checks
+from extra_checks.checks.base_checks import PendingMessage
+from extra_checks.ignore import IgnoreRules
 from tests.example import models
+from tests.example.serializers import ArticleSerializer
 
 
 @pytest.fixture
@@ -35,6 +39,22 @@ def test_ignore_model_check(test_case):
     assert not messages
 
 
+def test_ignore_decorated_model_check(test_case):
+    messages = (
+        test_case.models(models.DisableCheckDecoratedModel)
+        .settings(
+            {
+                "checks": [
+                    {"id": model_checks.CheckModelAttribute.Id.value, "attrs": ["site"]}
+                ]
+            }
+        )
+        .check(model_checks.CheckModelAttribute)
+        .run()
+    )
+    assert not messages
+
+
 def test_ignore_many_model_check(test_case):
     messages = (
         test_case.models(models.DisableManyChecksModel)
@@ -57,6 +77,25 @@ def test_ignore_many_model_check(test_case):
     assert not messages
 
 
+def test_disabled_messages_not_created(test_case, monkeypatch):
+    created = []
+    to_message = PendingMessage.to_message
+
+    def track(self):
+        created.append(self.obj)
+        return to_message(self)
+
+    monkeypatch.setattr(PendingMessage, "to_message", track)
+    messages = (
+        test_case.models(models.DisableManyChecksModel)
+        .settings({"checks": [model_field_checks.CheckFieldVerboseName.Id.value]})
+        .check(model_field_checks.CheckFieldVerboseName)
+        .run()
+    )
+    assert not messages
+    assert not created
+
+
 def test_field_skipif(test_case):
     def skipif(field, *args, **kwargs):
         return isinstance(field, django.db.models.ImageField)
@@ -104,3 +143,63 @@ def test_model_skipif(test_case):
         .run()
     )
     assert len(messages) == 0
+
+
+def test_ignore_rules(test_case):
+    checks = [
+        model_field_checks.CheckFieldTextNull,
+        model_field_checks.CheckFieldVerboseName,
+        model_checks.CheckModelMetaAttribute,
+    ]
+    test_case.models(models.ModelFieldTextNull, models.Article).check(*checks)
+    config = {
+        "checks": [
+            model_field_checks.CheckFieldTextNull.Id.value,
+            model_field_checks.CheckFieldVerboseName.Id.value,
+            {
+                "id": model_checks.CheckModelMetaAttribute.Id.value,
+                "attrs": ["ordering"],
+            },
+        ]
+    }
+    messages = test_case.settings(config).run()
+    assert {m.id for m in messages} == {"X050", "X055", "X011"}
+
+    messages = test_case.settings(
+        {
+            **config,
+            "ignore": {
+                "example.ModelFieldTextNull": ["field-verbose-name", "X011"],
+                "example.ModelFieldTextNull.text_fail": ["X055"],
+                "example.article": ["X011"],
+            },
+        }
+    ).run()
+    assert {(m.id, m.obj.name) for m in messages if m.id != "X050"} == {
+        ("X055", "chars_fail"),
+        ("X055", "custom_fail"),
+    }
+    assert {m.obj.model for m in messages if m.id == "X050"} == {models.Article}
+
+    messages = test_case.settings({**config, "ignore": {"example.*": ["X050"]}}).run()
+    assert {m.id for m in messages} == {"X055", "X011"}
+
+
+def test_ignore_rules_resolve():
+    rules = IgnoreRules(
+        {
+            "example.*": frozenset([CheckId.X010]),
+            "example.Article": frozenset([CheckId.X011]),
+            "example.Article.author": frozenset([CheckId.X050]),
+            "example.ArticleSerializer": frozenset([CheckId.X301]),
+        }
+    )
+    field = models.Article._meta.get_field("author")
+    assert rules.resolve(models.Article) == {CheckId.X010, CheckId.X011}
+    assert rules.resolve(field) == {CheckId.X010, CheckId.X011, CheckId.X050}
+    assert rules.resolve(field) is rules.resolve(field)
+    assert rules.resolve(models.Author) == {CheckId.X010}
+    assert rules.resolve(ArticleSerializer) == {CheckId.X010, CheckId.X301}
+    assert not IgnoreRules().resolve(models.Article)
+    with pytest.raises(ValueError):
+        IgnoreRules({"example": frozenset()})
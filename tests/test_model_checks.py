@@ -2,8 +2,12 @@ import pytest
 
 from extra_checks.checks import model_checks
 from tests.example.models import (
+    AbstractInheritedFields,
+    AbstractInheritedFieldsChild,
+    AnotherInheritedFieldsModel,
     Article,
     Author,
+    InheritedFieldsModel,
     ModelFieldForeignKeyIndex,
     ModelFieldTextNull,
 )
@@ -21,6 +25,28 @@ def test_get_models_to_check():
         assert model._meta.app_label == "example"
 
 
+def test_get_models_to_check_abstract_bases():
+    models = list(
+        model_checks._get_models_to_check(
+            models_=[InheritedFieldsModel, AnotherInheritedFieldsModel, Article]
+        )
+    )
+    assert models == [
+        AbstractInheritedFields,
+        AbstractInheritedFieldsChild,
+        InheritedFieldsModel,
+        AnotherInheritedFieldsModel,
+        Article,
+    ]
+    assert AbstractInheritedFields in model_checks._get_models_to_check()
+    # abstract bases of not checked apps are skipped
+    assert list(
+        model_checks._get_models_to_check(
+            models_=[InheritedFieldsModel], include_apps=[]
+        )
+    ) == [InheritedFieldsModel]
+
+
 def test_get_models_to_check_include_apps():
     models = list(model_checks._get_models_to_check(include_apps=[]))
     assert not models
@@ -26,6 +26,64 @@ def test_check_field_verbose_name(test_case):
     }
 
 
+def test_check_inherited_fields_once(test_case):
+    messages = (
+        test_case.settings(
+            {
+                "checks": [
+                    model_field_checks.CheckFieldVerboseName.Id.value,
+                    model_field_checks.CheckFieldTextNull.Id.value,
+                ]
+            }
+        )
+        .models(
+            *model_checks._get_models_to_check(
+                models_=[
+                    models.InheritedFieldsModel,
+                    models.AnotherInheritedFieldsModel,
+                ]
+            )
+        )
+        .check(model_field_checks.CheckFieldVerboseName)
+        .check(model_field_checks.CheckFieldTextNull)
+        .run()
+    )
+    assert sorted((m.obj.model.__name__, m.obj.name, m.id) for m in messages) == [
+        ("AbstractInheritedFields", "text_fail", "X050"),
+        ("AbstractInheritedFields", "text_fail", "X055"),
+        ("AnotherInheritedFieldsModel", "title", "X050"),
+    ]
+
+
+def test_check_inherited_fields_with_model_options(test_case):
+    checks = [
+        model_field_checks.CheckFieldForeignKeyIndex.Id.value,
+        model_field_checks.CheckFieldChoicesConstraint.Id.value,
+    ]
+    test_case = (
+        test_case.models(
+            *model_checks._get_models_to_check(
+                models_=[models.InheritedChoicesConstraint]
+            )
+        )
+        .check(model_field_checks.CheckFieldForeignKeyIndex)
+        .check(model_field_checks.CheckFieldChoicesConstraint)
+    )
+    messages = test_case.settings({"checks": checks}).run()
+    # constraints and indexes are declared in Meta of the concrete model
+    assert sorted((m.obj.model.__name__, m.obj.name, m.id) for m in messages) == [
+        ("InheritedChoicesConstraint", "author", "X058"),
+        ("InheritedChoicesConstraint", "missed", "X060"),
+    ]
+    messages = test_case.settings(
+        {
+            "checks": checks,
+            "ignore": {"example.InheritedChoicesConstraint.missed": ["X060"]},
+        }
+    ).run()
+    assert [(m.obj.name, m.id) for m in messages] == [("author", "X058")]
+
+
 def test_check_field_verbose_name_gettext(test_case):
     messages = (
         test_case.models(models.ModelFieldVerboseName)
@@ -256,3 +314,32 @@ def test_field_choices_constraint(test_case):
         f"{arg_name}=models.Q(integer_blank_invalid__in=[1, 2])"
         in errors["integer_blank_invalid"].hint
     )
+
+
+def test_field_choices_nested_constraint(test_case):
+    messages = (
+        test_case.settings(
+            {"checks": [model_field_checks.CheckFieldChoicesConstraint.Id.value]}
+        )
+        .models(models.NestedChoicesConstraint)
+        .check(model_field_checks.CheckFieldChoicesConstraint)
+        .run()
+    )
+    assert {m.obj.name for m in messages} == {"negated", "alternative"}
+
+
+def test_field_checks_table():
+    upload_to = model_field_checks.CheckFieldFileUploadTo()
+    text_null = model_field_checks.CheckFieldTextNull()
+    related_name = model_field_checks.CheckFieldRelatedName()
+    verbose_name = model_field_checks.CheckFieldVerboseName()
+    table = model_checks.FieldChecksTable(
+        [upload_to, text_null, related_name, verbose_name]
+    )
+    assert table
+    assert not model_checks.FieldChecksTable([])
+    assert table[django.db.models.ImageField] == [upload_to, verbose_name]
+    assert table[django.db.models.SlugField] == [text_null, verbose_name]
+    assert table[django.db.models.OneToOneField] == [related_name, verbose_name]
+    assert table[django.db.models.IntegerField] == [verbose_name]
+    assert table[django.db.models.IntegerField] is table[django.db.models.IntegerField]
@@ -0,0 +1,82 @@
+import pytest
+
+from extra_checks.checks import model_checks, model_field_checks
+from extra_checks.profiling import Profiler, profiler
+from tests.example import models
+
+
+@pytest.fixture(autouse=True)
+def disable_profiler():
+    yield
+    profiler.disable()
+
+
+def test_profiler_report():
+    p = Profiler()
+    assert p.call("source", "load", len, "abc") == 3
+    assert not p.stats
+    p.enable()
+    assert list(p.iterate("check", "X050", iter([1, 2]))) == [1, 2]
+    assert p.call("source", "load", len, "abc") == 3
+    assert p.call("source", "load", len, "ab") == 2
+    assert p.stats["check", "X050"].calls == 1
+    assert p.stats["check", "X050"].messages == 2
+    assert p.stats["source", "load"].calls == 2
+    p.stats["source", "load"].time = 2.0
+    p.stats["check", "X050"].time = 1.0
+    lines = p.report().splitlines()
+    assert lines[2].split() == ["source", "load", "2", "0", "2.0000"]
+    assert lines[3].split() == ["check", "X050", "1", "2", "1.0000"]
+    p.disable()
+    assert not p.stats
+
+
+def test_wrap_handler_streams_messages():
+    p = Profiler()
+    p.enable()
+    produced = []
+
+    def handler():
+        for i in range(2):
+            produced.append(i)
+            yield i
+
+    messages = p.wrap_handler("models", handler)()
+    assert next(messages) == 0
+    assert produced == [0]
+    assert list(messages) == [1]
+    assert p.stats["handler", "models"].messages == 2
+    p.disable()
+
+
+def test_profile_checks(test_case, tmp_path):
+    output = tmp_path / "profile.txt"
+    messages = (
+        test_case.handler(model_checks.check_models)
+        .models(models.ModelFieldTextNull)
+        .check(model_field_checks.CheckFieldTextNull)
+        .settings(
+            {
+                "profile": True,
+                "profile_output": str(output),
+                "checks": [
+                    {
+                        "id": model_field_checks.CheckFieldTextNull.Id.value,
+                        "skipif": lambda field: field.name == "chars_fail",
+                    }
+                ],
+            }
+        )
+        .run()
+    )
+    assert len(messages) == 2
+    assert profiler.enabled
+    stats = profiler.stats
+    assert stats["handler", test_case.TEST_TAG].messages == 2
+    assert stats["check", "X055"].messages == 2
+    assert stats["skipif", "X055"].calls == stats["check", "X055"].calls
+    assert stats["ast", "is_disabled_by_comment"].calls == 2
+    profiler.write_report()
+    report = output.read_text()
+    assert "X055" in report
+    assert "skipif" in report
@@ -0,0 +1,43 @@
+import django.core.checks
+import pytest
+
+from extra_checks import runner
+from extra_checks.checks import model_checks, model_field_checks
+from tests.example import models
+
+
+def _summary(messages):
+    return [(m.id, m.msg, m.obj) for m in messages]
+
+
+@pytest.mark.parametrize("jobs", [2, 3])
+def test_parallel_models_check(test_case, jobs):
+    test_case.handler(model_checks.check_models).models(
+        models.ModelFieldVerboseName,
+        models.ModelFieldTextNull,
+        models.ModelFieldFileUploadTo,
+        models.Article,
+        models.Author,
+    ).check(
+        model_field_checks.CheckFieldVerboseName,
+        model_field_checks.CheckFieldTextNull,
+        model_field_checks.CheckFieldFileUploadTo,
+    )
+    checks = [
+        model_field_checks.CheckFieldVerboseName.Id.value,
+        model_field_checks.CheckFieldTextNull.Id.value,
+        model_field_checks.CheckFieldFileUploadTo.Id.value,
+    ]
+    expected = test_case.settings({"checks": checks}).run()
+    assert expected
+    messages = test_case.settings({"checks": checks, "jobs": jobs}).run()
+    assert _summary(messages) == _summary(expected)
+
+
+def test_parallel_unpicklable_messages():
+    def produce(obj):
+        # message object is not related to the checked class
+        yield django.core.checks.Warning(obj.__name__, obj=object)
+
+    messages = list(runner.run([int, str, bytes], produce, jobs=2))
+    assert [m.msg for m in messages] == ["int", "str", "bytes"]
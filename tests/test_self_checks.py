@@ -12,6 +12,7 @@ from extra_checks.checks import (
 )
 from extra_checks.checks.base_checks import BaseCheck
 from extra_checks.registry import Registry
+from extra_checks.registry import registry as default_registry
 from extra_checks.utils import collect_subclasses
 
 
@@ -61,6 +62,7 @@ def test_error_formatting(registry, settings):
 
 def test_unique_check_ids():
     pytest.importorskip("rest_framework")
+    default_registry.load_check_modules(CheckId)
     used_checks = [
         c.Id for c in collect_subclasses(BaseCheck.__subclasses__()) if hasattr(c, "Id")
     ]
@@ -68,3 +70,87 @@ def test_unique_check_ids():
     assert not unused, "Not all CheckIds used."
     dups = {c.value for c in used_checks if used_checks.count(c) > 1}
     assert not dups, "CheckIds must be unique per Check."
+
+
+def test_bind_lazy(registry, settings):
+    settings.EXTRA_CHECKS = {"checks": [CheckFieldForeignKeyIndex.Id.value]}
+    registry._register([django.core.checks.Tags.models], CheckFieldForeignKeyIndex)
+    registry._add_handler("extra_checks_selfcheck", check_extra_checks_health)
+    handlers = registry.bind_lazy()
+    assert registry._config is None
+    assert not registry.enabled_checks
+
+    # config is read on the first run
+    settings.EXTRA_CHECKS = {
+        "checks": [{"id": CheckFieldForeignKeyIndex.Id.value, "when": "random"}]
+    }
+    messages = list(handlers["extra_checks_selfcheck"]())
+    assert len(messages) == 1
+    assert messages[0].id == CheckConfig.Id.name
+    assert not registry.is_healthy
+    # checks are created once
+    assert len(list(handlers["extra_checks_selfcheck"]())) == 1
+    assert len(registry.enabled_checks["extra_checks_selfcheck"]) == 1
+
+
+def test_load_check_modules(monkeypatch):
+    imported: list[str] = []
+    monkeypatch.setattr("importlib.import_module", imported.append)
+    registry = Registry()
+    registry.add_check_family(["one", "two"], ["tag"], [CheckId.X050, CheckId.X051])
+    registry.add_check_family(["three"], ["tag"], [CheckId.X301])
+    registry.load_check_modules([CheckId.X051])
+    assert imported == ["one", "two"]
+
+
+@pytest.mark.parametrize(
+    "error, raises",
+    [
+        # optional package isn't installed
+        (ModuleNotFoundError(name="rest_framework.serializers"), False),
+        (ModuleNotFoundError(name="rest_framwork"), True),
+        (ImportError("cannot import name 'CheckId'"), True),
+    ],
+)
+def test_load_check_modules_errors(monkeypatch, error, raises):
+    registry = Registry()
+    registry.add_check_family(
+        ["checks"], ["tag"], [CheckId.X301], optional=["rest_framework"]
+    )
+
+    def import_module(name):
+        raise error
+
+    monkeypatch.setattr("importlib.import_module", import_module)
+    if raises:
+        with pytest.raises(ImportError):
+            registry.load_check_modules([CheckId.X301])
+    else:
+        registry.load_check_modules([CheckId.X301])
+
+
+def test_entry_point_handler_runs_in_django_checks(monkeypatch, settings):
+    monkeypatch.setattr(
+        django.core.checks.registry.registry, "registered_checks", set()
+    )
+    settings.EXTRA_CHECKS = {"checks": [CheckFieldForeignKeyIndex.Id.value]}
+    registry = Registry(entry_points_group="test_extra_checks")
+
+    def handler(checks, config, app_configs=None, **kwargs):
+        return [django.core.checks.Warning("entry point", id=checks[0].Id.name)]
+
+    class EntryPoint:
+        def load(self):
+            registry._register(["entry_point_tag"], CheckFieldForeignKeyIndex)
+            registry._add_handler("entry_point_tag", handler)
+
+    class EntryPoints:
+        def select(self, group):
+            return [EntryPoint()] if group == "test_extra_checks" else []
+
+    monkeypatch.setattr("importlib.metadata.entry_points", EntryPoints)
+    registry.bind_lazy()
+    messages = django.core.checks.run_checks(tags=["entry_point_tag"])
+    assert [(m.msg, m.id) for m in messages] == [
+        ("entry point", CheckFieldForeignKeyIndex.Id.name)
+    ]
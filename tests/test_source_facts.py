@@ -0,0 +1,60 @@
+import pytest
+
+from extra_checks.ast.source_facts import SourceFactsCache
+from extra_checks.ast.source_provider import ModuleSource, source_store
+from extra_checks.checks import model_field_checks
+from extra_checks.checks.model_checks import check_models
+from tests.example import models
+
+
+@pytest.fixture
+def store(monkeypatch):
+    for name in ("_modules", "_stats", "_filenames"):
+        monkeypatch.setattr(source_store, name, {})
+    monkeypatch.setattr(source_store, "facts_cache", None)
+    return source_store
+
+
+def test_facts_cache(store, tmp_path):
+    module = store.get_module(models.ModelFieldVerboseName)
+    assert module is not None
+    facts = module.find_class_facts(models.ModelFieldVerboseName)
+    assert facts is not None
+    assert facts.fields["first_arg_name"].first_arg == (
+        False,
+        None,
+        "first arg name [test]",
+    )
+    cache = SourceFactsCache(str(tmp_path))
+    assert cache.get(module.digest) is None
+    cache.set(module.digest, module.facts)
+    assert cache.get(module.digest) == module.facts
+
+
+def test_facts_reused_by_config_change(test_case, store, monkeypatch, tmp_path):
+    test_case = (
+        test_case.handler(check_models)
+        .models(models.ModelFieldVerboseName, models.DisableManyChecksModel)
+        .check(model_field_checks.CheckFieldVerboseName)
+    )
+    messages = test_case.settings(
+        {"cache_dir": str(tmp_path), "checks": ["field-verbose-name"]}
+    ).run()
+    assert messages
+    assert {m.obj.model for m in messages} == {models.ModelFieldVerboseName}
+    assert any((tmp_path / "facts").iterdir())
+    for name in ("_modules", "_stats", "_filenames"):
+        monkeypatch.setattr(store, name, {})
+
+    def tree(self):
+        raise AssertionError("stored facts must be used")
+
+    monkeypatch.setattr(ModuleSource, "tree", property(tree))
+    changed = test_case.settings(
+        {
+            "cache_dir": str(tmp_path),
+            "checks": [{"id": "field-verbose-name", "level": "ERROR"}],
+        }
+    ).run()
+    assert [(m.msg, m.obj) for m in changed] == [(m.msg, m.obj) for m in messages]
+    assert all(m.is_serious() for m in changed)
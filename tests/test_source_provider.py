@@ -0,0 +1,115 @@
+import importlib
+import linecache
+import os
+import sys
+
+from extra_checks.ast.source_provider import (
+    ModuleSource,
+    SourceProvider,
+    SourceStore,
+    release_sources,
+    source_store,
+)
+from extra_checks.check_id import ALL_CHECKS_MASK, CheckId, to_mask
+from tests.example import models
+
+
+def test_source_store_shares_module():
+    article = SourceProvider(models.Article)
+    author = SourceProvider(models.Author)
+    assert article.module is not None
+    assert article.module is author.module
+    assert article.module is source_store.get_module(models.Author)
+
+
+def test_source_provider_class_node():
+    """classes nested into blocks and functions are found by their qualname"""
+
+    class LocalClass:
+        pass
+
+    node = SourceProvider(models.Author).node
+    assert node is not None
+    assert node.name == "Author"
+    node = SourceProvider(LocalClass).node
+    assert node is not None
+    assert node.name == "LocalClass"
+
+
+def test_source_provider_disabled_checks():
+    provider = SourceProvider(models.DisableCheckModel)
+    assert provider.node is not None
+    assert provider.get_disabled_checks_for_line(provider.node.lineno) == (
+        CheckId.X010.bit
+    )
+    assert provider.is_disabled_for_line(provider.node.lineno, CheckId.X010)
+    assert not provider.is_disabled_for_line(provider.node.lineno, CheckId.X011)
+    assert SourceProvider(int).get_disabled_checks_for_line(1) == 0
+
+
+def test_module_source_disabled_checks_index():
+    source = ModuleSource(
+        "example.py",
+        [
+            "# extra-checks-disable-next-line field-null\n",
+            "# regular comment\n",
+            "# extra-checks-disable-next-line X050, unknown\n",
+            "a = 1\n",
+            "# extra-checks-disable-next-line\n",
+            "\n",
+            "b = '''\n",
+            "# extra-checks-disable-next-line\n",
+            "'''\n",
+            "    # extra-checks-disable-next-line\n",
+            "c = 1  # extra-checks-disable-next-line\n",
+            "d = 1\n",
+        ],
+    )
+    assert source.get_disabled_checks_for_line(4) == to_mask(
+        [CheckId.X057, CheckId.X050]
+    )
+    # blank line stops the comment block
+    assert not source.get_disabled_checks_for_line(7)
+    # comments inside strings and trailing comments are ignored
+    assert not source.get_disabled_checks_for_line(9)
+    assert source.get_disabled_checks_for_line(11) == ALL_CHECKS_MASK
+    assert not source.get_disabled_checks_for_line(12)
+
+
+def test_source_store_revalidate(tmp_path, monkeypatch):
+    path = tmp_path / "revalidated_module.py"
+    path.write_text("class A:\n    pass\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    # the module is removed from sys.modules on teardown
+    monkeypatch.delitem(sys.modules, "revalidated_module", raising=False)
+    module = importlib.import_module("revalidated_module")
+    store = SourceStore()
+    source = store.get_module(module.A)
+    assert source is not None
+    store.revalidate()
+    assert store.get_module(module.A) is source
+    path.write_text("# changed\nclass A:\n    pass\n")
+    os.utime(path, ns=(0, 0))
+    store.revalidate()
+    changed = store.get_module(module.A)
+    assert changed is not source
+    assert changed is not None
+    assert changed.lines[0] == "# changed\n"
+
+
+def test_release_sources():
+    source = source_store.get_module(models.Article)
+    assert source is not None
+    objects = release_sources([models.Article, models.Author, int])
+    assert next(objects) is models.Article
+    assert source.find_class(models.Article) is not None
+    assert next(objects) is models.Author
+    assert "tree" in source.__dict__
+    assert next(objects) is int
+    assert "tree" not in source.__dict__
+    assert source._lines is None
+    assert source.filename not in linecache.cache
+    # released tree is parsed again on demand
+    node = source.find_class(models.Author)
+    assert node is not None
+    assert node.name == "Author"
@@ -0,0 +1,88 @@
+import json
+import os
+import subprocess
+import sys
+from io import StringIO
+
+from django.core.management import call_command
+
+from extra_checks import CheckId
+from extra_checks.static import STATIC_CHECKS, StaticChecker, main
+from tests.example import models
+
+
+def test_same_messages_as_django_checks():
+    out = StringIO()
+    call_command(
+        "extra_checks",
+        "--app",
+        "example",
+        *(arg for c in STATIC_CHECKS for arg in ("--check", c.name)),
+        "--fail-level",
+        "CRITICAL",
+        stdout=out,
+    )
+    expected = set()
+    for line in out.getvalue().splitlines():
+        message = json.loads(line)
+        expected.add((message["obj"].split(".", 1)[1], message["id"], message["line"]))
+    checker = StaticChecker(STATIC_CHECKS, meta_attrs=["db_table"])
+    result = {(m.obj, m.id.name, m.line) for m in checker.check_file(models.__file__)}
+    assert result == expected
+
+
+def test_model_bases(tmp_path):
+    path = tmp_path / "models.py"
+    path.write_text(
+        "from django.db import models\n"
+        "from project.models import BaseModel\n"
+        "\n"
+        "class Abstract(models.Model):\n"
+        "    name = models.CharField(max_length=10)\n"
+        "\n"
+        "    class Meta:\n"
+        "        abstract = True\n"
+        "\n"
+        "class Child(Abstract):\n"
+        "    title = models.CharField(null=False)\n"
+        "\n"
+        "class Project(BaseModel):\n"
+        "    title = models.CharField(null=False)\n"
+    )
+    checker = StaticChecker([CheckId.X057])
+    assert [m.obj for m in checker.check_file(str(path))] == ["Child.title"]
+    checker = StaticChecker([CheckId.X057], model_bases=["BaseModel"])
+    assert [m.obj for m in checker.check_file(str(path))] == [
+        "Child.title",
+        "Project.title",
+    ]
+
+
+def test_main(tmp_path, capsys):
+    app = tmp_path / "app"
+    app.mkdir()
+    (app / "models.py").write_text(
+        "from django.db import models\n"
+        "\n"
+        "class Article(models.Model):\n"
+        "    # extra-checks-disable-next-line field-null\n"
+        "    text = models.TextField(null=False)\n"
+        "    title = models.CharField(null=False)\n"
+    )
+    (app / "views.py").write_text(
+        "class View(Model):\n    x = models.Field(null=False)\n"
+    )
+    assert main([str(tmp_path), "--check", "field-null"]) == 1
+    assert capsys.readouterr().out == (
+        f"{app / 'models.py'}:6:5: X057 Argument `null=False` is default. [field-null]\n"
+    )
+    assert main([str(app / "views.py"), "--check", "X050"]) == 1
+    assert main([str(app / "models.py"), "--check", "X013"]) == 0
+
+
+def test_runs_without_django():
+    code = (
+        "import sys, extra_checks.static; assert 'django.db.models' not in sys.modules"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
@@ -1,3 +1,6 @@
+import sys
+
+from extra_checks.check_id import ALL_CHECKS_MASK, CheckId, to_mask
 from extra_checks.utils import collect_subclasses
 
 
@@ -18,3 +21,32 @@ def test_collect_subclasses():
 
     serializers = collect_subclasses(Base.__subclasses__())
     assert set(serializers) == {One, Two, Three}
+
+
+def test_collect_subclasses_deep_hierarchy():
+    """hierarchy deeper than the recursion limit"""
+    classes = [type("Base", (), {})]
+    for i in range(300):
+        classes.append(type(f"Sub{i}", (classes[-1],), {}))
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(200)
+    try:
+        assert list(collect_subclasses([classes[0]])) == classes[::-1]
+    finally:
+        sys.setrecursionlimit(limit)
+
+
+def test_check_id_bits():
+    assert len({c.bit for c in CheckId}) == len(CheckId)
+    # bits are dense to keep masks small
+    assert ALL_CHECKS_MASK == (1 << len(CheckId)) - 1
+    assert to_mask([CheckId.X050, CheckId.X057]) & CheckId.X057.bit
+    assert not to_mask([CheckId.X050]) & CheckId.X057.bit
+    assert ALL_CHECKS_MASK == to_mask(CheckId)
+
+
+def test_find_check():
+    assert CheckId.find_check("field-null") is CheckId.X057
+    assert CheckId.find_check("X057") is CheckId.X057
+    assert CheckId.find_check(CheckId.X057) is CheckId.X057
+    assert CheckId.find_check("X014") is None
@@ -0,0 +1,65 @@
+import inspect
+import os
+import subprocess
+
+import pytest
+
+from extra_checks.checks import model_checks
+from extra_checks.vcs import filter_changed_models, get_changed_files, is_changed
+from tests.example import models
+
+
+def _git(path, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=path,
+        check=True,
+        capture_output=True,
+    )
+
+
+def test_get_changed_files(tmp_path):
+    (tmp_path / "a.py").write_text("a = 1\n")
+    (tmp_path / "b.py").write_text("b = 1\n")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+    (tmp_path / "a.py").write_text("a = 2\n")
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "c.py").write_text("c = 1\n")
+    changed = get_changed_files("HEAD", cwd=str(tmp_path / "pkg"))
+    root = os.path.realpath(tmp_path)
+    assert changed == frozenset(
+        [os.path.join(root, "a.py"), os.path.join(root, "pkg", "c.py")]
+    )
+
+
+def test_get_changed_files_error(tmp_path):
+    with pytest.warns(RuntimeWarning):
+        assert get_changed_files("HEAD", cwd=str(tmp_path)) is None
+
+
+def test_filter_changed_models():
+    changed_files = frozenset([os.path.realpath(inspect.getfile(models))])
+    assert is_changed(models.Article, changed_files)
+    assert not is_changed(models.Article, frozenset())
+    unchanged = type(
+        "Unchanged", (), {"__module__": "extra_checks.vcs", "__qualname__": "X"}
+    )
+    assert not is_changed(unchanged, changed_files)
+
+    all_models = list(model_checks._get_models_to_check())
+    assert list(filter_changed_models(all_models, changed_files)) == all_models
+    assert not list(filter_changed_models(all_models, frozenset()))
+
+
+def test_filter_related_models(monkeypatch):
+    monkeypatch.setattr(
+        "extra_checks.vcs.is_changed", lambda cls, files: cls is models.Author
+    )
+    result = set(
+        filter_changed_models(
+            [models.Author, models.Article, models.ModelFieldTextNull], frozenset()
+        )
+    )
+    assert result == {models.Author, models.Article}